@@ -16,11 +16,25 @@ from langchain_core.prompts import ChatPromptTemplate
 
 from app.models.knowledge import KBDocument, KBCategory
 from app.utils import flatten_list, format_kb_document_content, validate_yaml_frontmatter, fix_yaml_frontmatter
-from app.ai_core.prompts.generation import UPDATE_PROMPT
+from app.ai_core.prompts.generation import UPDATE_PROMPT, UPDATE_USER_PROMPT_TEMPLATE
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
+
+# Scalar frontmatter fields refreshed after an AI update, matched in a single pass
+# and dispatched on the named group (match.lastgroup)
+_METADATA_FIELDS_RE = re.compile(
+    r'(?P<last_updated>last_updated:\s*"[^"]*")'
+    r'|(?P<history_from>history_from:\s*"[^"]*")'
+    r'|(?P<history_to>history_to:\s*"[^"]*")'
+    r"|(?P<message_limit>message_limit:\s*\d+)"
+    r"|(?P<ai_confidence>ai_confidence:\s*[\d.]+)"
+)
+
+_AI_REASONING_RE = re.compile(r'ai_reasoning:\s*["\'].*?["\'](?:\s|$)', re.DOTALL)
+
 
 class KBGenerator:
     """
@@ -265,7 +279,7 @@ class KBGenerator:
             Content with updated frontmatter metadata
         """
         # Extract frontmatter and body
-        frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.match(content)
         if not frontmatter_match:
             logger.warning("No frontmatter found in document, returning content as-is")
             return content
@@ -273,45 +287,31 @@ class KBGenerator:
         frontmatter = frontmatter_match.group(1)
         body = frontmatter_match.group(2)
 
+        metadata = new_document.extraction_metadata
+        extraction = new_document.extraction_output
+
         # Update last_updated to new_document's updated_at timestamp
         update_date = new_document.updated_at.strftime("%Y-%m-%d")
-        frontmatter = re.sub(
-            r'last_updated:\s*"[^"]*"', f'last_updated: "{update_date}"', frontmatter
-        )
+        replacements = {
+            "last_updated": f'last_updated: "{update_date}"',
+            "ai_confidence": f"ai_confidence: {extraction.ai_confidence:.2f}",
+        }
 
         # Update metadata fields from new_document if they exist
-        metadata = new_document.extraction_metadata
-        extraction = new_document.extraction_output
-
-        # Update history_from if present
         if metadata.history_from:
-            history_from_str = metadata.history_from.isoformat()
-            frontmatter = re.sub(
-                r'history_from:\s*"[^"]*"',
-                f'history_from: "{history_from_str}"',
-                frontmatter,
+            replacements["history_from"] = (
+                f'history_from: "{metadata.history_from.isoformat()}"'
             )
-
-        # Update history_to if present
         if metadata.history_to:
-            history_to_str = metadata.history_to.isoformat()
-            frontmatter = re.sub(
-                r'history_to:\s*"[^"]*"', f'history_to: "{history_to_str}"', frontmatter
+            replacements["history_to"] = (
+                f'history_to: "{metadata.history_to.isoformat()}"'
             )
-
-        # Update message_limit if present
         if metadata.message_limit is not None:
-            frontmatter = re.sub(
-                r"message_limit:\s*\d+",
-                f"message_limit: {metadata.message_limit}",
-                frontmatter,
-            )
+            replacements["message_limit"] = f"message_limit: {metadata.message_limit}"
 
-        # Update ai_confidence
-        ai_confidence_str = f"{extraction.ai_confidence:.2f}"
-        frontmatter = re.sub(
-            r"ai_confidence:\s*[\d.]+",
-            f"ai_confidence: {ai_confidence_str}",
+        # Fields without a replacement are left as they were
+        frontmatter = _METADATA_FIELDS_RE.sub(
+            lambda match: replacements.get(match.lastgroup, match.group(0)),
             frontmatter,
         )
 
@@ -326,11 +326,9 @@ class KBGenerator:
                 extraction.ai_reasoning, default_flow_style=True, allow_unicode=True
             ).strip()
         
-        frontmatter = re.sub(
-            r'ai_reasoning:\s*["\'].*?["\'](?:\s|$)',
+        frontmatter = _AI_REASONING_RE.sub(
             f"ai_reasoning: {ai_reasoning_yaml}\n",
             frontmatter,
-            flags=re.DOTALL,
         )
 
         # Reconstruct the document
@@ -380,8 +378,10 @@ class KBGenerator:
                 f"Formatted new content for category: {new_document.category.value}"
             )
 
-            # Create prompt
-            prompt = ChatPromptTemplate.from_messages([("system", UPDATE_PROMPT)])
+            # Create prompt: static instructions first, document content last
+            prompt = ChatPromptTemplate.from_messages(
+                [("system", UPDATE_PROMPT), ("human", UPDATE_USER_PROMPT_TEMPLATE)]
+            )
 
             # Build chain and invoke
             chain = prompt | llm
@@ -65,6 +65,9 @@ class PIIMasker:
             logger.error(f"Failed to initialize Orchestration service: {e}")
             raise MaskingError(f"Orchestration service initialization failed: {e}")
 
+        # The masking config does not depend on the message, so build it once
+        self.orchestration_config = self._create_orchestration_config()
+
     def _create_masking_config(self) -> MaskingModuleConfig:
         """
         Create Data Masking configuration.
@@ -118,7 +121,7 @@ class PIIMasker:
             ],
         )
 
-    def _create_orchestration_config(self, text: str) -> OrchestrationConfig:
+    def _create_orchestration_config(self) -> OrchestrationConfig:
         """Create orchestration configuration with DPI masking."""
 
         # Create template for the masking request
@@ -204,16 +207,17 @@ class PIIMasker:
             for conversation in masked_conversations:
                 # Build author mapping for this conversation
                 author_map = {}
-                next_user_num = 1
+                get_masked_name = author_map.get
 
                 for message in conversation.messages:
                     # Create masked author name if not already mapped
-                    if message.author_id not in author_map:
-                        author_map[message.author_id] = f"USER_{next_user_num}"
-                        next_user_num += 1
+                    masked_name = get_masked_name(message.author_id)
+                    if masked_name is None:
+                        masked_name = f"USER_{len(author_map) + 1}"
+                        author_map[message.author_id] = masked_name
 
                     # Update author_name with masked identifier
-                    message.author_name = author_map[message.author_id]
+                    message.author_name = masked_name
                     message.is_masked = True
 
             total_messages = sum(len(c.messages) for c in masked_conversations)
@@ -249,13 +253,10 @@ class PIIMasker:
 
         for attempt in range(self.settings.max_retries + 1):
             try:
-                # Create orchestration config
-                config = self._create_orchestration_config(message.content)
-
                 # Call orchestration service
                 result = await asyncio.to_thread(
                     self.orchestration_service.run,
-                    config=config,
+                    config=self.orchestration_config,
                     placeholder_values={"input": message.content},
                 )
 
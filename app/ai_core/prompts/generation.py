@@ -137,17 +137,15 @@ Key Points:
 Generate the complete markdown document following these guidelines.
 """
 
+# Static instructions only, so the prompt prefix is byte-identical across
+# updates and eligible for provider-side prompt caching. Per-update content
+# goes in UPDATE_USER_PROMPT_TEMPLATE, sent after this system message.
 UPDATE_PROMPT = """
 You are a technical writer updating knowledge base documentation.
 
 ## Task
 Update the existing KB document based on new information.
-
-## Existing Document
-{existing_content}
-
-## New Information
-{new_information}
+Both are provided in the following message.
 
 """ + YAML_FORMATTING_RULES + """
 
@@ -212,6 +210,14 @@ Provide the complete updated markdown document with:
 - No duplicate or new section headers
 """
 
+UPDATE_USER_PROMPT_TEMPLATE = """
+## Existing Document
+{existing_content}
+
+## New Information
+{new_information}
+"""
+
 # Template sections for different KB types
 TEMPLATE_SECTIONS = {
     "troubleshooting": ["Problem", "Root Cause", "Solution", "Prevention"],
@@ -24,7 +24,6 @@ from app.models.thread import (
     Source,
     SourceType,
 )
-from app.ai_core.masking.pii_masker import PIIMasker
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -122,12 +121,11 @@ async def mask_message(request: MaskMessageRequest):
             last_activity_at=datetime.now(),
         )
 
-        # Initialize masker and mask the conversation
+        # Mask the conversation with the orchestrator's shared masker
         try:
-            masker = PIIMasker()
-            masked_conversations = await masker.mask_conversations([temp_conversation])
+            masked_conversations = await orchestrator.masker.mask_conversations([temp_conversation])
         except Exception as masker_error:
-            logger.error(f"Failed to initialize or use PIIMasker: {str(masker_error)}", exc_info=True)
+            logger.error(f"Failed to use PIIMasker: {str(masker_error)}", exc_info=True)
             raise HTTPException(
                 status_code=503,
                 detail=f"PII masking service unavailable: {str(masker_error)}",
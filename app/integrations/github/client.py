@@ -23,6 +23,12 @@ from app.utils import flatten_list
 
 logger = logging.getLogger(__name__)
 
+# Frontmatter boundaries, with and without a newline after the closing ---
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+_FRONTMATTER_LOOSE_RE = re.compile(r'^---\s*\n(.*?)\n---\s*(.*)$', re.DOTALL)
+_BRANCH_UNSAFE_CHARS_RE = re.compile(r"[^a-zA-Z0-9\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class GitHubClient:
     """GitHub API client wrapper."""
@@ -183,11 +189,11 @@ class GitHubClient:
         try:
             # Use regex to properly match frontmatter boundaries
             # This handles cases where --- might appear in the YAML content
-            match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
+            match = _FRONTMATTER_RE.match(content)
             
             if not match:
                 # Try alternative pattern without newline after closing ---
-                match = re.match(r'^---\s*\n(.*?)\n---\s*(.*)$', content, re.DOTALL)
+                match = _FRONTMATTER_LOOSE_RE.match(content)
             
             if not match:
                 logger.warning("Could not find valid frontmatter boundaries")
@@ -465,9 +471,9 @@ class GitHubClient:
             Sanitized branch name
         """
         # Sanitize title for branch name
-        sanitized = re.sub(r"[^a-zA-Z0-9\s-]", "", title)  # Remove special chars
-        sanitized = re.sub(
-            r"\s+", "-", sanitized.strip()
+        sanitized = _BRANCH_UNSAFE_CHARS_RE.sub("", title)  # Remove special chars
+        sanitized = _WHITESPACE_RE.sub(
+            "-", sanitized.strip()
         )  # Replace spaces with hyphens
         sanitized = sanitized.lower()[:50]  # Lowercase and limit length
 
@@ -20,7 +20,7 @@ from app.utils.helpers import validate_yaml_frontmatter
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PRResult:
     """Result of PR creation."""
 
@@ -27,6 +27,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent conversations.replies calls (kept low for Slack's Tier 3 rate limit)
+THREAD_FETCH_CONCURRENCY = 8
+
 
 class SlackClient:
     """Slack API client for conversation fetching with thread expansion."""
@@ -169,6 +172,48 @@ class SlackClient:
             logger.error(f"Error fetching thread replies {thread_ts}: {e}")
             raise
 
+    async def _fetch_threads_concurrently(
+        self, channel_id: str, raw_messages: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch replies for every threaded message, at most THREAD_FETCH_CONCURRENCY at a time.
+
+        If any fetch fails, the fetches still queued or running are cancelled and
+        the error is re-raised.
+
+        Args:
+            channel_id: Slack channel ID
+            raw_messages: Raw channel messages (successfully parsed parents only)
+
+        Returns:
+            Dict mapping thread_ts to its raw messages (including the parent message)
+        """
+        thread_ts_list = list(
+            dict.fromkeys(
+                msg_data["ts"]
+                for msg_data in raw_messages
+                if msg_data.get("reply_count", 0) > 0 and msg_data.get("ts")
+            )
+        )
+        if not thread_ts_list:
+            return {}
+
+        semaphore = asyncio.Semaphore(THREAD_FETCH_CONCURRENCY)
+
+        async def fetch_bounded(thread_ts: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.fetch_thread_replies(channel_id, thread_ts)
+
+        logger.info(f"Fetching {len(thread_ts_list)} threads concurrently")
+        tasks = [asyncio.create_task(fetch_bounded(ts)) for ts in thread_ts_list]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return dict(zip(thread_ts_list, results))
+
     async def fetch_conversations_with_threads(
         self,
         channel_id: Optional[str] = None,
@@ -182,7 +227,7 @@ class SlackClient:
         This method:
         1. Fetches main channel messages (in reverse chronological order from Slack)
         2. Detects threaded messages (reply_count > 0)
-        3. Fetches all thread replies and inserts them chronologically after parent
+        3. Fetches all thread replies concurrently and inserts them chronologically after parent
         4. Assigns global indexing (idx) and parent references (parent_idx)
 
         Returns:
@@ -226,53 +271,53 @@ class SlackClient:
             processed_threads = set()
             current_idx = 0
 
-            # Step 2: Process messages in chronological order and detect threads
-            # Note: Slack API returns messages in reverse chronological order, so we reverse
+            # Parse the channel messages first, in chronological order (Slack returns
+            # them newest first), so threads are only fetched for parents we keep
+            parsed_messages = []
             for msg_data in reversed(raw_messages):
-                # Parse main message
                 main_msg = self._parse_message_to_standardized(msg_data, current_idx)
                 if main_msg:
-                    all_standardized_messages.append(main_msg)
-                    main_msg_idx = current_idx
-                    current_idx += 1
-
-                    # Thread detection: check if message has replies
-                    reply_count = msg_data.get("reply_count", 0)
-                    thread_ts = msg_data.get("ts")
-
-                    if (
-                        reply_count > 0
-                        and thread_ts
-                        and thread_ts not in processed_threads
-                    ):
-                        logger.info(
-                            f"Found thread with {reply_count} replies: {thread_ts}"
-                        )
-
-                        # Step 3: Fetch thread replies
-                        thread_raw_messages = await self.fetch_thread_replies(
-                            actual_channel_id, thread_ts
-                        )
-
-                        # Add replies (skip first message as it's the parent we already have)
-                        if len(thread_raw_messages) > 1:
-                            thread_replies_raw = thread_raw_messages[
-                                1:
-                            ]  # Skip parent message
-
-                            for reply_data in thread_replies_raw:
-                                reply_msg = self._parse_message_to_standardized(
-                                    reply_data, current_idx, parent_idx=main_msg_idx
-                                )
-                                if reply_msg:
-                                    all_standardized_messages.append(reply_msg)
-                                    current_idx += 1
-
-                            logger.info(
-                                f"Added {len(thread_replies_raw)} thread replies"
+                    parsed_messages.append((msg_data, main_msg))
+
+            # Fetch all thread replies concurrently (bounded) instead of one by one
+            thread_replies_by_ts = await self._fetch_threads_concurrently(
+                actual_channel_id, [msg_data for msg_data, _ in parsed_messages]
+            )
+
+            # Step 2: Assign global indexes and insert each thread after its parent
+            for msg_data, main_msg in parsed_messages:
+                main_msg.idx = current_idx
+                all_standardized_messages.append(main_msg)
+                main_msg_idx = current_idx
+                current_idx += 1
+
+                # Thread detection: check if message has replies
+                reply_count = msg_data.get("reply_count", 0)
+                thread_ts = msg_data.get("ts")
+
+                if reply_count > 0 and thread_ts and thread_ts not in processed_threads:
+                    logger.info(f"Found thread with {reply_count} replies: {thread_ts}")
+
+                    # Step 3: Get thread replies (fetched concurrently above)
+                    thread_raw_messages = thread_replies_by_ts[thread_ts]
+
+                    # Add replies (skip first message as it's the parent we already have)
+                    if len(thread_raw_messages) > 1:
+                        thread_replies_raw = thread_raw_messages[
+                            1:
+                        ]  # Skip parent message
+
+                        for reply_data in thread_replies_raw:
+                            reply_msg = self._parse_message_to_standardized(
+                                reply_data, current_idx, parent_idx=main_msg_idx
                             )
+                            if reply_msg:
+                                all_standardized_messages.append(reply_msg)
+                                current_idx += 1
+
+                        logger.info(f"Added {len(thread_replies_raw)} thread replies")
 
-                        processed_threads.add(thread_ts)
+                    processed_threads.add(thread_ts)
 
             # Step 4: Calculate conversation metadata
             if all_standardized_messages:
@@ -45,6 +45,20 @@ from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Free text below both limits cannot yield a KB document, so skip the LLM pipeline.
+# The character limit keeps unspaced scripts (e.g. CJK), which split into very
+# few "words", from being ignored
+MIN_TEXT_WORDS = 5
+MIN_TEXT_CHARS = 30
+
+# Precompiled patterns for answer parsing and relevance scoring
+_SOURCES_RE = re.compile(r'Sources:\s*\[(.*?)\]', re.IGNORECASE | re.DOTALL)
+_SOURCE_SEPARATOR_RE = re.compile(r'],\s*\[')
+_INLINE_CITATION_RE = re.compile(r'According to [""]?([^"",]*?)[""]?,')
+_URL_RE = re.compile(r'https?://\S+')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_WORD_RE = re.compile(r'\b\w+\b')
+
 
 class KBOrchestrator:
     """
@@ -172,6 +186,20 @@ class KBOrchestrator:
         try:
             logger.info("Starting text input processing pipeline")
 
+            # Fast path: too little text to extract anything, skip masking/LLM calls
+            word_count = len(text.split())
+            char_count = len(text.strip())
+            if word_count < MIN_TEXT_WORDS and char_count < MIN_TEXT_CHARS:
+                logger.info(
+                    f"Text too short for KB extraction ({word_count} words, {char_count} chars), ignoring"
+                )
+                return KBProcessingResponse(
+                    status="success",
+                    action=KBActionType.IGNORE,
+                    reason=f"Text has insufficient content for KB extraction (fewer than {MIN_TEXT_WORDS} words and {MIN_TEXT_CHARS} characters). Please provide more detail.",
+                    text_length=len(text),
+                )
+
             # Step 1: Convert text to StandardizedConversation
             conversation = self._text_to_conversation(text, title, metadata)
             logger.info(f"Created conversation from text ({len(text)} chars)")
@@ -290,20 +318,18 @@ class KBOrchestrator:
             cited_sources = []
 
             # Try to extract Sources section from the answer
-            sources_pattern = r'Sources:\s*\[(.*?)\]'
-            sources_match = re.search(sources_pattern, answer, re.IGNORECASE | re.DOTALL)
+            sources_match = _SOURCES_RE.search(answer)
 
             if sources_match:
                 # Extract sources list
                 sources_text = sources_match.group(1)
-                source_titles = [s.strip() for s in re.split(r'],\s*\[', sources_text)]
+                source_titles = [s.strip() for s in _SOURCE_SEPARATOR_RE.split(sources_text)]
                 source_titles = [s.replace(']', '').replace('[', '') for s in source_titles]
                 cited_sources = source_titles
 
             # If no sources section found, check for inline citations
             if not cited_sources:
-                inline_pattern = r'According to [""]?([^"",]*?)[""]?,'
-                inline_matches = re.findall(inline_pattern, answer)
+                inline_matches = _INLINE_CITATION_RE.findall(answer)
                 cited_sources = inline_matches
 
             # If still no sources found, include all relevant docs
@@ -342,10 +368,10 @@ class KBOrchestrator:
                 # Extract specific information if the query is looking for it
                 if is_url_query:
                     # Look for URLs in the content
-                    urls = re.findall(r'https?://\S+', content)
+                    urls = _URL_RE.findall(content)
                     if urls:
                         # Use the sentence containing the URL as excerpt
-                        sentences = re.split(r'(?<=[.!?])\s+', content)
+                        sentences = _SENTENCE_SPLIT_RE.split(content)
                         for sentence in sentences:
                             if any(url in sentence for url in urls):
                                 excerpt = sentence
@@ -355,7 +381,7 @@ class KBOrchestrator:
                 if len(excerpt) > 150:  # Only if we haven't found a specific excerpt yet
                     query_terms = query.lower().split()
                     if len(query_terms) >= 2:  # Only for multi-word queries
-                        sentences = re.split(r'(?<=[.!?])\s+', content)
+                        sentences = _SENTENCE_SPLIT_RE.split(content)
                         # Look for sentences with multiple query terms
                         for sentence in sentences:
                             sentence_lower = sentence.lower()
@@ -515,7 +541,7 @@ class KBOrchestrator:
             logger.info(f"CREATE action: Generating new KB document")
             markdown_content = self.generator.generate_markdown(kb_document)
 
-        kb_summary = self._generate_document_summary(markdown_content)
+        kb_summary = await self._generate_document_summary(markdown_content)
 
         # Step 5: Create GitHub PR
         config = get_settings()
@@ -669,7 +695,7 @@ class KBOrchestrator:
 
         return conversation
 
-    def _generate_document_summary(self, markdown_content: str) -> str:
+    async def _generate_document_summary(self, markdown_content: str) -> str:
         """
         Generate a concise summary of the KB document using LLM.
 
@@ -696,7 +722,7 @@ class KBOrchestrator:
 
             prompt = prompt_template.format(markdown_content=markdown_content)
             messages = [HumanMessage(content=prompt)]
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
 
             # Check if response has content
             if not response or not response.content:
@@ -842,7 +868,7 @@ class KBOrchestrator:
                       'can', 'could', 'would', 'should', 'will', 'shall', 'may', 'might',
                       'must', 'need', 'have', 'has', 'had', 'been', 'was', 'were', 'am',
                       'that', 'this', 'these', 'those', 'which', 'who', 'whom', 'whose'}
-        query_words = set(re.findall(r'\b\w+\b', query_lower))
+        query_words = set(_WORD_RE.findall(query_lower))
         query_keywords = query_words - stop_words
 
         scored_docs = []
@@ -855,7 +881,7 @@ class KBOrchestrator:
             tags = [tag.lower() for tag in doc.get("tags", [])]
 
             # Title matches
-            title_words = set(re.findall(r'\b\w+\b', title))
+            title_words = set(_WORD_RE.findall(title))
             title_match_count = len(query_keywords.intersection(title_words))
             score += title_match_count * 0.5
 
@@ -3,6 +3,9 @@ Validation utilities for input data.
 """
 import re
 
+# Full GitHub repository URL: https://github.com/owner/repo (groups: owner, repo)
+_GITHUB_REPO_URL_RE = re.compile(r'^https://github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_.-]+)/?$')
+
 
 def validate_github_url(url: str) -> tuple[bool, str]:
     """
@@ -18,10 +21,7 @@ def validate_github_url(url: str) -> tuple[bool, str]:
     if not url:
         return False, "GitHub repository URL is required."
 
-    # Pattern for full GitHub URL: https://github.com/owner/repo
-    pattern = r'^https://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+/?$'
-
-    if not re.match(pattern, url.strip()):
+    if not _GITHUB_REPO_URL_RE.match(url.strip()):
         return False, "Invalid GitHub URL format. Please use the full URL format: https://github.com/owner/repo"
 
     return True, "Valid GitHub repository URL."
@@ -71,8 +71,7 @@ def extract_owner_repo_from_url(url: str) -> tuple[str, str]:
     Returns:
         tuple: (owner, repo) or (None, None) if invalid
     """
-    pattern = r'https://github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_.-]+)/?$'
-    match = re.match(pattern, url.strip())
+    match = _GITHUB_REPO_URL_RE.match(url.strip())
 
     if match:
         return match.group(1), match.group(2)
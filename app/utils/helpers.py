@@ -7,10 +7,15 @@ Common helper functions used across multiple modules.
 import re
 import yaml
 import logging
+from itertools import chain
 from typing import Any, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Frontmatter block (group 1) followed by the markdown body (group 2)
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+_FRONTMATTER_BLOCK_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
 
 def flatten_list(items: Any) -> List[str]:
     """
@@ -37,21 +42,11 @@ def flatten_list(items: Any) -> List[str]:
     if not isinstance(items, list):
         return [str(items)]
 
-    # Flatten nested lists
-    result = []
-    for item in items:
-        if isinstance(item, list):
-            for subitem in item:
-                if isinstance(subitem, str):
-                    result.append(subitem)
-                else:
-                    result.append(str(subitem))
-        elif isinstance(item, str):
-            result.append(item)
-        else:
-            result.append(str(item))
-
-    return result
+    # Flatten one level of nesting; str() returns strings unchanged
+    leaves = chain.from_iterable(
+        item if isinstance(item, list) else (item,) for item in items
+    )
+    return list(map(str, leaves))
 
 
 def sanitize_yaml_string(value: str) -> str:
@@ -105,7 +100,7 @@ def fix_yaml_frontmatter(content: str) -> str:
     
     try:
         # Extract frontmatter and body
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
         if not match:
             logger.warning("Could not find valid frontmatter boundaries")
             return content
@@ -206,7 +201,7 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str]]:
     
     try:
         # Extract frontmatter using regex
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+        match = _FRONTMATTER_BLOCK_RE.match(content)
         if not match:
             return False, "Could not find valid frontmatter boundaries (---...---)"
         
@@ -229,25 +224,9 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str]]:
         return False, error_msg
 
 
-def format_kb_document_content(kb_document: "KBDocument") -> str:
-    """
-    Format KB document content based on category.
-
-    This is a shared utility used by both KBMatcher (for matching) and
-    KBGenerator (for AI-powered updates). Formats the document content
-    in a structured way based on the document's category.
-
-    Args:
-        kb_document: The KB document to format
-
-    Returns:
-        Formatted string representation of the document content
-    """
-    extraction = kb_document.extraction_output
-    category = kb_document.category.value
-
-    if category == "troubleshooting":
-        return f"""### Problem Description
+def _format_troubleshooting_content(extraction: Any) -> str:
+    """Format the sections of a troubleshooting guide."""
+    return f"""### Problem Description
 {extraction.problem_description}
 
 ### Environment
@@ -270,8 +249,10 @@ def format_kb_document_content(kb_document: "KBDocument") -> str:
 ### Related Links
 {extraction.related_links or 'None'}"""
 
-    elif category == "processes":
-        return f"""### Overview
+
+def _format_processes_content(extraction: Any) -> str:
+    """Format the sections of a process document."""
+    return f"""### Overview
 {extraction.process_overview}
 
 ### Prerequisites
@@ -289,8 +270,10 @@ def format_kb_document_content(kb_document: "KBDocument") -> str:
 ### Related Processes
 {extraction.related_processes or 'None'}"""
 
-    elif category == "decisions":
-        return f"""### Context
+
+def _format_decisions_content(extraction: Any) -> str:
+    """Format the sections of a decision record."""
+    return f"""### Context
 {extraction.decision_context}
 
 ### Decision
@@ -312,8 +295,10 @@ def format_kb_document_content(kb_document: "KBDocument") -> str:
 ### Implementation Notes
 {extraction.implementation_notes or 'None'}"""
 
-    elif category == "references":
-        return f"""### Question Context
+
+def _format_references_content(extraction: Any) -> str:
+    """Format the sections of a reference document."""
+    return f"""### Question Context
 {extraction.question_context}
 
 ### Resource Type
@@ -337,8 +322,10 @@ def format_kb_document_content(kb_document: "KBDocument") -> str:
 ### Related Topics
 {extraction.related_topics or 'None'}"""
 
-    elif category == "general":
-        return f"""### Summary
+
+def _format_general_content(extraction: Any) -> str:
+    """Format the sections of a general knowledge document."""
+    return f"""### Summary
 {extraction.summary}
 
 ### Key Topics
@@ -353,5 +340,32 @@ def format_kb_document_content(kb_document: "KBDocument") -> str:
 ### Participants Context
 {extraction.participants_context}"""
 
-    else:
-        return "Content format not available for this category"
\ No newline at end of file
+
+# Section formatter for each KB category value
+_CONTENT_FORMATTERS = {
+    "troubleshooting": _format_troubleshooting_content,
+    "processes": _format_processes_content,
+    "decisions": _format_decisions_content,
+    "references": _format_references_content,
+    "general": _format_general_content,
+}
+
+
+def format_kb_document_content(kb_document: "KBDocument") -> str:
+    """
+    Format KB document content based on category.
+
+    This is a shared utility used by both KBMatcher (for matching) and
+    KBGenerator (for AI-powered updates). Formats the document content
+    in a structured way based on the document's category.
+
+    Args:
+        kb_document: The KB document to format
+
+    Returns:
+        Formatted string representation of the document content
+    """
+    formatter = _CONTENT_FORMATTERS.get(kb_document.category.value)
+    if formatter is None:
+        return "Content format not available for this category"
+    return formatter(kb_document.extraction_output)
\ No newline at end of file
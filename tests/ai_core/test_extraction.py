@@ -11,6 +11,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import re
 import pytest
 import asyncio
 from datetime import datetime, timezone
@@ -25,6 +26,9 @@ from app.models.thread import (
 )
 from app.models.knowledge import KBCategory
 
+# Timestamp format used by the conversation formatter (YYYY-MM-DD HH:MM:SS)
+TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
 
 @pytest.fixture
 def sample_troubleshooting_conversation():
@@ -370,17 +374,14 @@ def test_format_conversation_structure(sample_threaded_conversation):
     assert "Thanks! That worked." in formatted
 
     # Verify timestamp format (YYYY-MM-DD HH:MM:SS)
-    import re
-
-    timestamp_pattern = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
-    timestamps = re.findall(timestamp_pattern, formatted)
-    assert len(timestamps) == 4, f"Expected 4 timestamps, found {len(timestamps)}"
+    timestamp_count = sum(1 for _ in TIMESTAMP_RE.finditer(formatted))
+    assert timestamp_count == 4, f"Expected 4 timestamps, found {timestamp_count}"
 
     print("\n✅ All format checks passed!")
     print(f"   - Sequential numbering: ✓")
     print(f"   - idx labeling: ✓")
     print(f"   - Thread structure: ✓ ({reply_count} replies)")
-    print(f"   - Timestamp format: ✓ ({len(timestamps)} timestamps)")
+    print(f"   - Timestamp format: ✓ ({timestamp_count} timestamps)")
     print(f"   - Content preservation: ✓")
 
 
@@ -10,6 +10,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
+import traceback
 from datetime import datetime
 
 from app.models.thread import (
@@ -119,8 +120,6 @@ async def test_gerrit_exclusion():
 
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-
         traceback.print_exc()
 
 
@@ -40,6 +40,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
+import argparse
 import time
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
@@ -200,7 +201,7 @@ Contact the payments team for more details.
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestConfig:
     """Test configuration settings."""
     verbose: bool = False
@@ -214,7 +215,7 @@ class TestConfig:
         return self.verbose or not self.dry_run or self.test_filter is not None or self.include_slack
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Test execution result."""
     name: str
@@ -222,7 +223,7 @@ class TestResult:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance timing metrics."""
     extraction_time: float = 0.0
@@ -247,8 +248,8 @@ class TestOutputFormatter:
     @staticmethod
     def print_test_status(test_name: str, passed: bool, details: str = None):
         status = "✅ PASS" if passed else "❌ FAIL"
-        dots = "." * (45 - len(test_name))
-        print(f"  {test_name} {dots} {status}")
+        # Dot leader pads "name " to a fixed column before the status
+        print(f"  {test_name + ' ':.<46} {status}")
         if details:
             print(f"      → {details}")
 
@@ -314,21 +315,27 @@ class TestOutputFormatter:
                     print(f"   • {result.name}: {result.message}")
 
 
+# All formatter methods are static, so one shared instance serves every test
+_FORMATTER = TestOutputFormatter()
+
+
 class PerformanceTracker:
     """Tracks and manages performance timing."""
 
     def __init__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         self.metrics = PerformanceMetrics()
 
     def start_extraction(self):
-        self.extraction_start = time.time()
+        self.extraction_start = time.perf_counter_ns()
 
     def end_extraction(self):
-        self.metrics.extraction_time = time.time() - self.extraction_start
+        self.metrics.extraction_time = (
+            time.perf_counter_ns() - self.extraction_start
+        ) / 1e9
 
     def finalize(self):
-        self.metrics.total_time = time.time() - self.start_time
+        self.metrics.total_time = (time.perf_counter_ns() - self.start_time) / 1e9
         return self.metrics
 
 
@@ -340,8 +347,10 @@ class BasePipelineTest:
     """Base class for pipeline tests."""
 
     def __init__(self):
-        self.formatter = TestOutputFormatter()
+        self.formatter = _FORMATTER
         self.tracker = PerformanceTracker()
+        # Pipeline response from the last test run, for verbose reporting
+        self.last_response = None
 
     def _validate_env(self) -> bool:
         """Validate required environment variables."""
@@ -368,8 +377,8 @@ class MockPipelineTest(BasePipelineTest):
             )
             self.tracker.end_extraction()
 
-            if config.verbose:
-                self.formatter.print_verbose_result(result)
+            # Kept for the runner, which prints it next to this test's status line
+            self.last_response = result
 
             # Validate
             if result.status == "error":
@@ -403,8 +412,8 @@ class MockPipelineTest(BasePipelineTest):
             )
             self.tracker.end_extraction()
 
-            if config.verbose:
-                self.formatter.print_verbose_result(result)
+            # Kept for the runner, which prints it next to this test's status line
+            self.last_response = result
 
             # Validate
             if result.status == "error":
@@ -436,8 +445,8 @@ class MockPipelineTest(BasePipelineTest):
                 metadata={"test": "update_matching"},
             )
 
-            if config.verbose:
-                self.formatter.print_verbose_result(result)
+            # Kept for the runner, which prints it next to this test's status line
+            self.last_response = result
 
             # Validate
             if result.status == "error":
@@ -481,8 +490,8 @@ class RealPipelineTest(BasePipelineTest):
                 limit=config.slack_limit,
             )
 
-            if config.verbose:
-                self.formatter.print_verbose_result(result)
+            # Kept for the runner, which prints it next to this test's status line
+            self.last_response = result
 
             # Validate
             if result.status == "error":
@@ -510,7 +519,7 @@ class PipelineTestRunner:
     """Main test runner."""
 
     def __init__(self):
-        self.formatter = TestOutputFormatter()
+        self.formatter = _FORMATTER
 
     async def run_tests(self, test_mode: str, config: TestConfig) -> List[TestResult]:
         """Run tests based on mode."""
@@ -545,32 +554,45 @@ class PipelineTestRunner:
         """Run text input tests (troubleshooting, process, update)."""
         self.formatter.print_header("Text Input Pipeline Tests")
 
-        text_test = MockPipelineTest()
-        results = []
-
         # Check for test filter
         test_filter = config.test_filter
 
+        # Collect the selected tests
+        selected = []
+
         # Troubleshooting test
         if test_filter is None or test_filter == "troubleshooting":
-            result = await text_test.test_troubleshooting_kb(config)
-            self.formatter.print_test_status("Troubleshooting KB", result.passed, result.message)
-            results.append(result)
+            selected.append(("Troubleshooting KB", MockPipelineTest.test_troubleshooting_kb))
 
         if test_mode != "quick" or test_filter:
             # Process test
             if test_filter is None or test_filter == "process":
-                result = await text_test.test_process_kb(config)
-                self.formatter.print_test_status("Process KB", result.passed, result.message)
-                results.append(result)
+                selected.append(("Process KB", MockPipelineTest.test_process_kb))
 
             # Update matching test
             if test_filter is None or test_filter == "update":
-                result = await text_test.test_update_matching(config)
-                self.formatter.print_test_status("Update Matching", result.passed, result.message)
-                results.append(result)
+                selected.append(("Update Matching", MockPipelineTest.test_update_matching))
+
+        # The tests are independent LLM round-trips, so run them concurrently.
+        # They print nothing while running; gather() keeps submission order, so
+        # each verbose block and status line is printed afterwards in test order.
+        # Each test gets its own instance so timings and responses don't clash.
+        instances = [MockPipelineTest() for _ in selected]
+        results = await asyncio.gather(
+            *(run(test, config) for (_, run), test in zip(selected, instances))
+        )
 
-        return results
+        for (name, _), test, result in zip(selected, instances, results):
+            self._print_test_report(name, test, result, config)
+
+        return list(results)
+
+    def _print_test_report(self, name: str, test: BasePipelineTest,
+                           result: TestResult, config: TestConfig):
+        """Print a test's verbose pipeline response (if any), then its status line."""
+        if config.verbose and test.last_response is not None:
+            self.formatter.print_verbose_result(test.last_response)
+        self.formatter.print_test_status(name, result.passed, result.message)
 
     async def _run_slack_tests(self, config: TestConfig) -> List[TestResult]:
         """Run Slack pipeline tests."""
@@ -581,7 +603,7 @@ class PipelineTestRunner:
 
         # Slack pipeline test
         result = await slack_test.test_slack_pipeline(config)
-        self.formatter.print_test_status("Slack Pipeline", result.passed, result.message)
+        self._print_test_report("Slack Pipeline", slack_test, result, config)
         results.append(result)
 
         return results
@@ -597,8 +619,6 @@ class ConfigParser:
     @staticmethod
     def parse_args() -> Tuple[str, TestConfig]:
         """Parse command line arguments."""
-        import argparse
-
         parser = argparse.ArgumentParser(
             description="Test Full KB Pipeline",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -649,7 +669,6 @@ Examples:
             os.environ["DRY_RUN"] = "true"
 
         # Clear the settings cache to pick up the new DRY_RUN value
-        from app.config import get_settings
         get_settings.cache_clear()
 
         # Create config
@@ -669,6 +688,20 @@ Examples:
 # Main Function
 # ============================================================================
 
+# Usage examples printed after each run ({script} is the invoked script path)
+USAGE_EXAMPLES = """
+💡 Test mode examples:
+   python {script} --mock                         # Dry-run, all text tests
+   python {script} --mock --test process          # Dry-run, process only
+   python {script} --real --test process -v       # Creates PR, process only
+   python {script} --mock --slack                 # Dry-run with Slack tests
+   python {script} --mock --slack --slack-limit 1 # Slack with 1 message
+   python {script} --real --slack -v              # Creates PRs with Slack
+   python {script} --quick                        # Quick smoke test
+
+"""
+
+
 async def main():
     """Main test execution function."""
     test_mode, config = ConfigParser.parse_args()
@@ -682,19 +715,20 @@ async def main():
     results = await runner.run_tests(test_mode, config)
 
     # Print usage examples
-    print(f"\n💡 Test mode examples:")
-    print(f"   python {sys.argv[0]} --mock                         # Dry-run, all text tests")
-    print(f"   python {sys.argv[0]} --mock --test process          # Dry-run, process only")
-    print(f"   python {sys.argv[0]} --real --test process -v       # Creates PR, process only")
-    print(f"   python {sys.argv[0]} --mock --slack                 # Dry-run with Slack tests")
-    print(f"   python {sys.argv[0]} --mock --slack --slack-limit 1 # Slack with 1 message")
-    print(f"   python {sys.argv[0]} --real --slack -v              # Creates PRs with Slack")
-    print(f"   python {sys.argv[0]} --quick                        # Quick smoke test\n")
+    sys.stdout.write(USAGE_EXAMPLES.format(script=sys.argv[0]))
 
     # Return exit code
     return 0 if all(r.passed for r in results) else 1
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
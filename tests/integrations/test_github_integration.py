@@ -27,6 +27,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
+import argparse
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
@@ -105,7 +106,7 @@ MOCK_PR_RESPONSE = {
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestConfig:
     """Test configuration settings."""
 
@@ -123,7 +124,7 @@ class TestConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Test execution result."""
 
@@ -132,7 +133,7 @@ class TestResult:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance timing metrics."""
 
@@ -163,8 +164,8 @@ class TestOutputFormatter:
     def print_test_status(test_name: str, passed: bool, details: str = None):
         """Print aligned test status."""
         status = "✅ PASS" if passed else "❌ FAIL"
-        dots = "." * (45 - len(test_name))
-        print(f"  {test_name} {dots} {status}")
+        # Dot leader pads "name " to a fixed column before the status
+        print(f"  {test_name + ' ':.<46} {status}")
         if details:
             print(f"      → {details}")
 
@@ -242,27 +243,33 @@ class TestOutputFormatter:
                     print(f"   • {result.name}: {result.message}")
 
 
+# All formatter methods are static, so one shared instance serves every test
+_FORMATTER = TestOutputFormatter()
+
+
 class PerformanceTracker:
     """Tracks and manages performance timing."""
 
     def __init__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         self.metrics = PerformanceMetrics()
 
     def start_api_timing(self):
-        self.api_start = time.time()
+        self.api_start = time.perf_counter_ns()
 
     def end_api_timing(self):
-        self.metrics.api_time = time.time() - self.api_start
+        self.metrics.api_time = (time.perf_counter_ns() - self.api_start) / 1e9
 
     def start_operations_timing(self):
-        self.operations_start = time.time()
+        self.operations_start = time.perf_counter_ns()
 
     def end_operations_timing(self):
-        self.metrics.operations_time = time.time() - self.operations_start
+        self.metrics.operations_time = (
+            time.perf_counter_ns() - self.operations_start
+        ) / 1e9
 
     def finalize(self):
-        self.metrics.total_time = time.time() - self.start_time
+        self.metrics.total_time = (time.perf_counter_ns() - self.start_time) / 1e9
         return self.metrics
 
 
@@ -321,7 +328,7 @@ class BaseGitHubTest:
     """Base class for GitHub integration tests."""
 
     def __init__(self):
-        self.formatter = TestOutputFormatter()
+        self.formatter = _FORMATTER
         self.tracker = PerformanceTracker()
 
     def _validate_credentials(self) -> bool:
@@ -381,7 +388,7 @@ class MockGitHubTest(BaseGitHubTest):
                 branch = client.generate_branch_name("Test Document")
                 valid_branch = branch == "kb/test-document"
 
-                success = all([has_repo, has_branch, valid_branch])
+                success = has_repo and has_branch and valid_branch
 
                 details = []
                 if not has_repo:
@@ -454,7 +461,7 @@ class MockGitHubTest(BaseGitHubTest):
                 valid_pr_url = pr_url.startswith("https://github.com/")
                 correct_doc_count = len(docs) == 3
 
-                success = all([has_documents, valid_pr_url, correct_doc_count])
+                success = has_documents and valid_pr_url and correct_doc_count
 
                 details = []
                 if not has_documents:
@@ -625,7 +632,7 @@ class MockGitHubTest(BaseGitHubTest):
                 operations_called = mock_client.create_or_update_file.call_count == 2
                 deletes_called = mock_client.delete_file.call_count == 1
 
-                success = all([valid_pr_url, operations_called, deletes_called])
+                success = valid_pr_url and operations_called and deletes_called
 
                 details = []
                 if not valid_pr_url:
@@ -939,7 +946,7 @@ class GitHubTestRunner:
     """Main test runner."""
 
     def __init__(self):
-        self.formatter = TestOutputFormatter()
+        self.formatter = _FORMATTER
 
     async def run_tests(self, test_mode: str, config: TestConfig) -> List[TestResult]:
         """Run tests based on mode."""
@@ -1094,8 +1101,6 @@ class ConfigParser:
     @staticmethod
     def parse_args() -> Tuple[str, TestConfig]:
         """Parse command line arguments."""
-        import argparse
-
         parser = argparse.ArgumentParser(
             description="Test GitHub Integration",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1168,17 +1173,12 @@ Examples:
     @staticmethod
     def _create_test_config(args, test_mode: str) -> TestConfig:
         """Create test configuration from arguments."""
-        config = TestConfig(verbose=args.verbose)
-
-        if args.limit:
-            config.limit = args.limit
-        if args.test_repo:
-            config.test_repo = args.test_repo
-
-        # Add dry_run flag to config
-        config.dry_run = getattr(args, "dry_run", False)
-
-        return config
+        return TestConfig(
+            verbose=args.verbose,
+            limit=args.limit or 10,
+            test_repo=args.test_repo or None,
+            dry_run=getattr(args, "dry_run", False),
+        )
 
 
 # ============================================================================
@@ -1186,6 +1186,20 @@ Examples:
 # ============================================================================
 
 
+# Usage examples printed after each run ({script} is the invoked script path)
+USAGE_EXAMPLES = """
+💡 Test mode examples:
+   python {script} --mock                           # Mock data testing (safe)
+   python {script} --real-read-only --verbose       # Real API, read-only (safe)
+   python {script} --real --verbose                 # Real API, creates PRs ⚠️
+   python {script} --real --limit 5                 # Real API, limit docs
+   python {script} --quick                          # Quick mock test
+   python {script} --list-repos                     # List repo config
+   python {script} --dry-run                        # Show what would be done
+
+"""
+
+
 async def main():
     """Main test execution function."""
     test_mode, config = ConfigParser.parse_args()
@@ -1196,27 +1210,16 @@ async def main():
     results = await runner.run_tests(test_mode, config)
 
     # Print usage examples
-    print(f"\n💡 Test mode examples:")
-    print(
-        f"   python {sys.argv[0]} --mock                           # Mock data testing (safe)"
-    )
-    print(
-        f"   python {sys.argv[0]} --real-read-only --verbose       # Real API, read-only (safe)"
-    )
-    print(
-        f"   python {sys.argv[0]} --real --verbose                 # Real API, creates PRs ⚠️"
-    )
-    print(
-        f"   python {sys.argv[0]} --real --limit 5                 # Real API, limit docs"
-    )
-    print(f"   python {sys.argv[0]} --quick                          # Quick mock test")
-    print(
-        f"   python {sys.argv[0]} --list-repos                     # List repo config"
-    )
-    print(
-        f"   python {sys.argv[0]} --dry-run                        # Show what would be done\n"
-    )
+    sys.stdout.write(USAGE_EXAMPLES.format(script=sys.argv[0]))
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
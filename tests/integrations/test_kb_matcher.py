@@ -2,6 +2,13 @@
 Integration tests for KB Matcher
 
 Tests the KBMatcher component with both mock and real GitHub data.
+
+Usage:
+    pytest -n auto tests/integrations/test_kb_matcher.py           # Parallel (pytest-xdist)
+    ARCHIE_REAL=1 pytest tests/integrations/test_kb_matcher.py      # Include real GitHub test
+    python tests/integrations/test_kb_matcher.py --mode mock        # Mock suite (default)
+    python tests/integrations/test_kb_matcher.py --mode real        # Real GitHub suite only
+    python tests/integrations/test_kb_matcher.py --mode both        # Both suites
 """
 
 import sys
@@ -11,12 +18,19 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import os
+import json
+import atexit
 import asyncio
 import logging
 import argparse
-from typing import List, Dict, Any
+import functools
+from typing import List, Dict, Any, Optional, Tuple
+
+import pytest
 
-from app.ai_core.matching import KBMatcher, MatchAction
+import app.services  # noqa: F401 - load services first to break the github<->services import cycle
+from app.ai_core.matching import KBMatcher, MatchAction, MatchResult
 from app.models.knowledge import (
     KBDocument,
     KBCategory,
@@ -35,6 +49,88 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Run every test on one module-scoped event loop: the shared KBMatcher and
+# GitHubClient hold pooled async HTTP connections bound to the loop they were
+# opened on, so per-test loops would leave them pointing at a closed loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Recorded GitHub API responses for repeatable test runs
+HTTP_FIXTURE_DIR = Path(__file__).parent.parent / "fixtures" / "http"
+# Markdown bodies for mock and pushed KB documents
+KB_FIXTURE_DIR = Path(__file__).parent.parent / "fixtures" / "kb_matcher"
+
+
+@functools.lru_cache(maxsize=None)
+def load_markdown_fixture(name: str) -> str:
+    """Read a KB markdown fixture once and reuse it across tests."""
+    return (KB_FIXTURE_DIR / name).read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_matcher() -> KBMatcher:
+    """
+    Return a process-wide KBMatcher.
+
+    Reusing one matcher keeps a single LLM proxy client, so its pooled HTTP
+    connections survive across tests instead of being re-established per test.
+    This relies on the module-scoped event loop set by pytestmark.
+    """
+    return KBMatcher()
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_github_client() -> GitHubClient:
+    """Return a process-wide GitHubClient whose HTTP session is closed at exit."""
+    github_client = GitHubClient()
+    atexit.register(github_client.client.close)
+    return github_client
+
+
+# Cap concurrent real GitHub API calls to stay clear of secondary rate limits
+GITHUB_MAX_CONCURRENCY = 8
+_gh_sem = asyncio.Semaphore(GITHUB_MAX_CONCURRENCY)
+
+
+async def gh_call(coro):
+    """Await a GitHub client coroutine while holding the shared concurrency slot."""
+    async with _gh_sem:
+        return await coro
+
+
+def cached_github_call(key: str):
+    """
+    Record a GitHub client call to disk on first run and replay it afterwards.
+
+    Responses are stored as JSON in tests/fixtures/http/<key>.json. Set
+    ARCHIE_REFRESH_FIXTURES=1 to force the real call and re-record the fixture.
+
+    Args:
+        key: Fixture file name (without extension)
+    """
+    fixture_path = HTTP_FIXTURE_DIR / f"{key}.json"
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            refresh = os.getenv("ARCHIE_REFRESH_FIXTURES") == "1"
+            if fixture_path.exists() and not refresh:
+                logger.info(f"Replaying recorded GitHub response: {fixture_path.name}")
+                return json.loads(fixture_path.read_text(encoding="utf-8"))
+
+            result = await gh_call(func(*args, **kwargs))
+
+            HTTP_FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+            # default=str handles dates parsed from YAML frontmatter
+            fixture_path.write_text(
+                json.dumps(result, indent=2, default=str), encoding="utf-8"
+            )
+            logger.info(f"Recorded GitHub response: {fixture_path.name}")
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 def create_sample_troubleshooting_document() -> KBDocument:
     """Create a sample troubleshooting KB document."""
@@ -194,22 +290,7 @@ def create_mock_existing_docs() -> List[Dict[str, Any]]:
             "path": "troubleshooting/database-connection-pool.md",
             "category": "troubleshooting",
             "tags": ["database", "postgresql", "connection-pool"],
-            "markdown_content": """Configuration guide for PostgreSQL connection pools.
-
-This document covers how to properly configure connection pools
-to avoid connection exhaustion and timeout issues.
-
-## Connection Pool Settings
-
-Configure the following parameters:
-- max_connections: Maximum number of connections
-- pool_size: Number of connections to maintain
-- timeout: Connection timeout in seconds
-
-## Common Issues
-
-Connection timeout errors can occur when the pool is exhausted.
-Monitor pool usage and adjust settings accordingly.""",
+            "markdown_content": load_markdown_fixture("db_pool.md"),
             "frontmatter": {
                 "title": "Database Connection Pool Configuration",
                 "category": "troubleshooting",
@@ -221,22 +302,7 @@ Monitor pool usage and adjust settings accordingly.""",
             "path": "troubleshooting/api-rate-limiting.md",
             "category": "troubleshooting",
             "tags": ["api", "rate-limit", "429"],
-            "markdown_content": """How to handle API rate limiting errors from external services.
-
-This guide covers strategies for dealing with 429 errors
-and implementing proper retry logic with exponential backoff.
-
-## Symptoms
-
-Requests to external API fail with 429 status code.
-Error message indicates rate limit exceeded.
-
-## Solutions
-
-1. Implement exponential backoff
-2. Add request queuing
-3. Cache responses when possible
-4. Monitor rate limit headers""",
+            "markdown_content": load_markdown_fixture("api_rate_limit.md"),
             "frontmatter": {
                 "title": "API Rate Limiting Issues",
                 "category": "troubleshooting",
@@ -248,32 +314,7 @@ Error message indicates rate limit exceeded.
             "path": "processes/production-deployment.md",
             "category": "processes",
             "tags": ["deployment", "production", "ci-cd"],
-            "markdown_content": """Standard operating procedure for production deployments.
-
-This process ensures safe and reliable deployments to production
-with proper validation and rollback capabilities.
-
-## Prerequisites
-
-- Code review approval
-- All tests passing
-- Security scan completed
-
-## Deployment Steps
-
-1. Create production branch
-2. Run full test suite
-3. Build production artifacts
-4. Deploy with blue-green strategy
-5. Monitor metrics for 30 minutes
-6. Switch traffic to new version
-
-## Validation
-
-- Check error rates
-- Monitor response times
-- Verify critical user flows
-- Check database performance""",
+            "markdown_content": load_markdown_fixture("prod_deploy.md"),
             "frontmatter": {
                 "title": "Production Deployment Process",
                 "category": "processes",
@@ -283,24 +324,81 @@ with proper validation and rollback capabilities.
     ]
 
 
+def filter_by_category(
+    docs: List[Dict[str, Any]], kb_document: KBDocument
+) -> List[Dict[str, Any]]:
+    """Keep only existing docs in the same category as the document being matched."""
+    return [d for d in docs if d.get("category") == kb_document.category.value]
+
+
+MATCH_RESULT_FIELDS = (
+    "action",
+    "confidence",
+    "document_path",
+    "document_title",
+    "category",
+    "reasoning",
+    "value_assessment",
+)
+
+
+def log_match_result(
+    result: MatchResult,
+    fields: Tuple[str, ...] = MATCH_RESULT_FIELDS,
+    max_chars: Optional[int] = 200,
+    indent: str = "",
+) -> None:
+    """
+    Log selected fields of a match result as a single record.
+
+    Formatting and truncation are skipped entirely when INFO is disabled,
+    which keeps quiet parallel runs (e.g. pytest -n auto) cheap.
+
+    Args:
+        result: Match result to log
+        fields: Field names to include, in order
+        max_chars: Truncate reasoning/value assessment to this length (None = full)
+        indent: Prefix for each line
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    def clip(text: Optional[str]) -> str:
+        text = text or ""
+        if max_chars is None:
+            return text
+        return f"{text[:max_chars]}..."
+
+    values = {
+        "action": ("Action", result.action.value),
+        "confidence": ("Confidence", result.confidence_score),
+        "document_path": ("Document Path", result.document_path),
+        "document_title": ("Document Title", result.document_title),
+        "category": ("Category", result.category),
+        "reasoning": ("Reasoning", clip(result.reasoning)),
+        "value_assessment": (
+            "Value Assessment",
+            clip(result.value_addition_assessment),
+        ),
+    }
+    lines = [f"{indent}{values[f][0]}: {values[f][1]}" for f in fields]
+    logger.info("%s", "\n".join(lines))
+
+
 async def test_create_new_document():
     """Test CREATE action when no similar documents exist."""
     logger.info("\n=== Test 1: CREATE New Document ===")
 
-    matcher = KBMatcher()
+    matcher = get_shared_matcher()
     kb_document = create_sample_decision_document()
     existing_docs = create_mock_existing_docs()
 
     # None of the existing docs are about architecture decisions
-    result = await matcher.match(kb_document, existing_docs)
+    result = await matcher.match(
+        kb_document, filter_by_category(existing_docs, kb_document)
+    )
 
-    logger.info(f"Action: {result.action.value}")
-    logger.info(f"Confidence: {result.confidence_score}")
-    logger.info(f"Document Path: {result.document_path}")
-    logger.info(f"Document Title: {result.document_title}")
-    logger.info(f"Category: {result.category}")
-    logger.info(f"Reasoning: {result.reasoning[:200]}...")
-    logger.info(f"Value Assessment: {result.value_addition_assessment[:200]}...")
+    log_match_result(result)
 
     assert result.action == MatchAction.CREATE, f"Expected CREATE, got {result.action}"
     assert result.document_path is not None, "document_path should be set for CREATE"
@@ -314,20 +412,16 @@ async def test_update_existing_document():
     """Test UPDATE action when similar document exists."""
     logger.info("\n=== Test 2: UPDATE Existing Document ===")
 
-    matcher = KBMatcher()
+    matcher = get_shared_matcher()
     kb_document = create_sample_troubleshooting_document()
     existing_docs = create_mock_existing_docs()
 
     # The database connection pool document is related
-    result = await matcher.match(kb_document, existing_docs)
+    result = await matcher.match(
+        kb_document, filter_by_category(existing_docs, kb_document)
+    )
 
-    logger.info(f"Action: {result.action.value}")
-    logger.info(f"Confidence: {result.confidence_score}")
-    logger.info(f"Document Path: {result.document_path}")
-    logger.info(f"Document Title: {result.document_title}")
-    logger.info(f"Category: {result.category}")
-    logger.info(f"Reasoning: {result.reasoning[:200]}...")
-    logger.info(f"Value Assessment: {result.value_addition_assessment[:200]}...")
+    log_match_result(result)
 
     # Note: This might be CREATE or UPDATE depending on LLM assessment
     assert result.action in [
@@ -345,7 +439,7 @@ async def test_ignore_low_quality():
     """Test IGNORE action for low quality content."""
     logger.info("\n=== Test 3: IGNORE Low Quality Content ===")
 
-    matcher = KBMatcher()
+    matcher = get_shared_matcher()
 
     # Create document with low confidence
     extraction = TroubleshootingExtraction(
@@ -378,73 +472,49 @@ async def test_ignore_low_quality():
     )
 
     existing_docs = create_mock_existing_docs()
-    result = await matcher.match(kb_document, existing_docs)
+    result = await matcher.match(
+        kb_document, filter_by_category(existing_docs, kb_document)
+    )
 
-    logger.info(f"Action: {result.action.value}")
-    logger.info(f"Confidence: {result.confidence_score}")
-    logger.info(f"Reasoning: {result.reasoning[:200]}...")
+    log_match_result(result, fields=("action", "confidence", "reasoning"))
 
     # Low confidence content should likely be IGNORE
     logger.info(f"✅ Test 3 COMPLETED - Action: {result.action.value}")
     return result
 
 
+@pytest.mark.skipif(
+    not os.getenv("ARCHIE_REAL"),
+    reason="Set ARCHIE_REAL=1 to run against the real GitHub API",
+)
 async def test_with_real_github():
     """Test with real GitHub repository data."""
     logger.info("\n=== Test 4: Real GitHub Integration ===")
 
     try:
-        github_client = GitHubClient()
+        github_client = get_shared_github_client()
         logger.info(f"Connected to GitHub: {github_client.repo.full_name}")
 
         # Step 1: Create and push a test document to GitHub
         logger.info("\n--- Step 1: Pushing test document to GitHub ---")
 
-        test_document_content = """---
-title: Test Redis Cache Timeout
-category: troubleshooting
-tags:
-    - redis
-    - cache
-    - timeout
-ai_confidence: 0.92
-created_date: 2026-02-10
----
-
-# Test Redis Cache Timeout
-
-## Problem Description
-Redis cache operations timing out after 5 seconds in production environment.
-
-## Environment
-- Redis 7.0
-- Ubuntu 22.04
-- Production
-
-## Symptoms
-Cache SET and GET operations fail with timeout errors after exactly 5 seconds.
-
-## Root Cause
-Default Redis timeout setting too conservative for network latency.
-
-## Solution
-1. Increase redis timeout to 10s in redis.conf
-2. Restart Redis server
-3. Monitor performance
-
-## Prevention
-Set appropriate timeouts based on network conditions and monitor latency.
-"""
+        test_document_content = load_markdown_fixture(
+            "test_redis_cache_timeout.md"
+        )
 
         test_document_path = "troubleshooting/test-redis-cache-timeout.md"
 
         try:
             # Create test branch
             test_branch = "test-kb-matcher-integration"
-            await github_client.create_branch(test_branch)
+            await cached_github_call(key="create_branch")(
+                github_client.create_branch
+            )(test_branch)
 
             # Write test document to branch
-            await github_client.create_or_update_file(
+            await cached_github_call(key="create_or_update_file")(
+                github_client.create_or_update_file
+            )(
                 branch_name=test_branch,
                 file_path=test_document_path,
                 content=test_document_content,
@@ -459,7 +529,9 @@ Set appropriate timeouts based on network conditions and monitor latency.
 
         # Step 2: Fetch all KB documents and verify our test document is there
         logger.info("\n--- Step 2: Fetching KB documents from GitHub ---")
-        all_docs = await github_client.read_kb_repository()
+        all_docs = await cached_github_call(key="read_kb_repository")(
+            github_client.read_kb_repository
+        )()
         logger.info(f"Fetched {len(all_docs)} real KB documents from GitHub")
 
         if len(all_docs) == 0:
@@ -486,13 +558,11 @@ Set appropriate timeouts based on network conditions and monitor latency.
 
         # Step 3: Test matching with real data
         logger.info("\n--- Step 3: Testing KB matching ---")
-        matcher = KBMatcher()
+        matcher = get_shared_matcher()
         kb_document = create_sample_troubleshooting_document()
 
         # Filter to same category for focused test
-        troubleshooting_docs = [
-            doc for doc in all_docs if doc.get("category") == "troubleshooting"
-        ]
+        troubleshooting_docs = filter_by_category(all_docs, kb_document)
         logger.info(
             f"Testing against {len(troubleshooting_docs)} troubleshooting documents"
         )
@@ -501,14 +571,8 @@ Set appropriate timeouts based on network conditions and monitor latency.
 
         assert result.action.value == MatchAction.CREATE
 
-        logger.info(f"\n✅ Match Results:")
-        logger.info(f"  Action: {result.action.value}")
-        logger.info(f"  Confidence: {result.confidence_score}")
-        logger.info(f"  Document Path: {result.document_path}")
-        logger.info(f"  Document Title: {result.document_title}")
-        logger.info(f"  Category: {result.category}")
-        logger.info(f"  Reasoning: {result.reasoning[:300]}...")
-        logger.info(f"  Value Assessment: {result.value_addition_assessment[:300]}...")
+        logger.info("\n✅ Match Results:")
+        log_match_result(result, max_chars=300, indent="  ")
 
         logger.info("\n✅ Test 4 PASSED - Real GitHub Integration")
         return result
@@ -525,15 +589,13 @@ async def test_empty_repository():
     """Test matching when repository is empty."""
     logger.info("\n=== Test 5: Empty Repository ===")
 
-    matcher = KBMatcher()
+    matcher = get_shared_matcher()
     kb_document = create_sample_troubleshooting_document()
     existing_docs = []  # Empty repository
 
     result = await matcher.match(kb_document, existing_docs)
 
-    logger.info(f"Action: {result.action.value}")
-    logger.info(f"Confidence: {result.confidence_score}")
-    logger.info(f"Document Path: {result.document_path}")
+    log_match_result(result, fields=("action", "confidence", "document_path"))
 
     assert (
         result.action == MatchAction.CREATE
@@ -548,7 +610,8 @@ async def test_all_categories():
     """Test matching for all category types."""
     logger.info("\n=== Test 6: All Categories ===")
 
-    matcher = KBMatcher()
+    matcher = get_shared_matcher()
+    # Deliberately unfiltered: exercises the matcher's own category prioritization
     existing_docs = create_mock_existing_docs()
 
     # Test troubleshooting
@@ -589,7 +652,7 @@ async def test_value_addition_assessment():
     """Test value addition assessment for different scenarios."""
     logger.info("\n=== Test 7: Value Addition Assessment ===")
 
-    matcher = KBMatcher()
+    matcher = get_shared_matcher()
     existing_docs = create_mock_existing_docs()
 
     # Create document that adds new information to existing topic
@@ -622,59 +685,84 @@ async def test_value_addition_assessment():
         extraction_metadata=metadata,
     )
 
-    result = await matcher.match(kb_document, existing_docs)
+    result = await matcher.match(
+        kb_document, filter_by_category(existing_docs, kb_document)
+    )
 
-    logger.info(f"Action: {result.action.value}")
-    logger.info(f"Confidence: {result.confidence_score}")
-    logger.info(f"Value Assessment:")
-    logger.info(f"  {result.value_addition_assessment}")
+    log_match_result(
+        result, fields=("action", "confidence", "value_assessment"), max_chars=None
+    )
 
     # This should likely UPDATE the connection pool document
     logger.info(f"✅ Test 7 COMPLETED - Action: {result.action.value}")
     return result
 
 
-async def run_all_tests(use_real_github: bool = False):
-    """Run all integration tests."""
+async def run_mock_tests() -> List[Tuple[str, Any]]:
+    """Run the mock-data test suite (no GitHub access)."""
+    results = []
+
+    # Test 1: CREATE new document
+    result1 = await test_create_new_document()
+    results.append(("Create New Document", result1))
+
+    # Test 2: UPDATE existing document
+    result2 = await test_update_existing_document()
+    results.append(("Update Existing", result2))
+
+    # Test 3: IGNORE low quality
+    result3 = await test_ignore_low_quality()
+    results.append(("Ignore Low Quality", result3))
+
+    # Test 5: Empty repository
+    result5 = await test_empty_repository()
+    results.append(("Empty Repository", result5))
+
+    # Test 6: All categories
+    result6 = await test_all_categories()
+    results.append(("All Categories", result6))
+
+    # Test 7: Value addition
+    result7 = await test_value_addition_assessment()
+    results.append(("Value Addition", result7))
+
+    return results
+
+
+async def run_real_tests() -> List[Tuple[str, Any]]:
+    """Run the real GitHub test suite (requires credentials)."""
+    results = []
+
+    # Test 4: Real GitHub
+    result4 = await test_with_real_github()
+    if result4:
+        results.append(("Real GitHub", result4))
+
+    return results
+
+
+async def run_all_tests(mode: str = "mock"):
+    """
+    Run integration tests for the selected mode.
+
+    Args:
+        mode: "mock" for mock data only, "real" for real GitHub only, or "both"
+    """
     logger.info("=" * 70)
-    logger.info("KB MATCHER INTEGRATION TESTS")
+    logger.info(f"KB MATCHER INTEGRATION TESTS (mode: {mode})")
     logger.info("=" * 70)
 
     results = []
 
     try:
-        # Test 1: CREATE new document
-        result1 = await test_create_new_document()
-        results.append(("Create New Document", result1))
-
-        # Test 2: UPDATE existing document
-        result2 = await test_update_existing_document()
-        results.append(("Update Existing", result2))
-
-        # Test 3: IGNORE low quality
-        result3 = await test_ignore_low_quality()
-        results.append(("Ignore Low Quality", result3))
-
-        # Test 4: Real GitHub (if enabled)
-        if use_real_github:
-            result4 = await test_with_real_github()
-            if result4:
-                results.append(("Real GitHub", result4))
+        if mode in ("mock", "both"):
+            results.extend(await run_mock_tests())
+
+        if mode in ("real", "both"):
+            results.extend(await run_real_tests())
         else:
             logger.info("\n=== Test 4: Real GitHub Integration ===")
-            logger.info("Skipped (use --real flag to enable)")
-
-        # Test 5: Empty repository
-        result5 = await test_empty_repository()
-        results.append(("Empty Repository", result5))
-
-        # Test 6: All categories
-        result6 = await test_all_categories()
-        results.append(("All Categories", result6))
-
-        # Test 7: Value addition
-        result7 = await test_value_addition_assessment()
-        results.append(("Value Addition", result7))
+            logger.info("Skipped (use --mode real or --mode both to enable)")
 
         # Print summary
         logger.info("\n" + "=" * 70)
@@ -710,11 +798,13 @@ async def quick_test():
     """Quick test with just basic functionality."""
     logger.info("Running quick test...")
 
-    matcher = KBMatcher()
+    matcher = get_shared_matcher()
     kb_document = create_sample_troubleshooting_document()
     existing_docs = create_mock_existing_docs()
 
-    result = await matcher.match(kb_document, existing_docs)
+    result = await matcher.match(
+        kb_document, filter_by_category(existing_docs, kb_document)
+    )
 
     logger.info(
         f"Result: {result.action.value} (confidence: {result.confidence_score})"
@@ -725,10 +815,16 @@ async def quick_test():
 def main():
     """Main entry point for tests."""
     parser = argparse.ArgumentParser(description="KB Matcher Integration Tests")
+    parser.add_argument(
+        "--mode",
+        choices=["mock", "real", "both"],
+        default="mock",
+        help="Test suite to run: mock data, real GitHub API (requires credentials), or both",
+    )
     parser.add_argument(
         "--real",
         action="store_true",
-        help="Test with real GitHub API (requires credentials)",
+        help="Alias for --mode both",
     )
     parser.add_argument("--quick", action="store_true", help="Run only quick test")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
@@ -738,10 +834,19 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # Use uvloop's faster event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     if args.quick:
         asyncio.run(quick_test())
     else:
-        asyncio.run(run_all_tests(use_real_github=args.real))
+        mode = "both" if args.real else args.mode
+        asyncio.run(run_all_tests(mode=mode))
 
 
 if __name__ == "__main__":
@@ -18,8 +18,12 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
+import io
 import logging
-from datetime import datetime
+import time
+from typing import Optional, TextIO
+
+import pytest
 
 from app.services.kb_orchestrator import KBOrchestrator
 from app.models.api_responses import KBActionType
@@ -31,17 +35,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Run the async tests under pytest-asyncio on one module-scoped event loop, so
+# the shared orchestrator's async LLM clients are always used on the loop they
+# were created for
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    """One orchestrator shared by all tests, so its clients are built once."""
+    return KBOrchestrator()
+
 
-async def test_text_to_kb_simple():
+# Each test prints its report to `out` (stdout when None). main() passes a
+# per-test buffer so concurrent runs can still print reports in test order.
+async def test_text_to_kb_simple(
+    orchestrator: KBOrchestrator, out: Optional[TextIO] = None
+):
     """
     Test Case 1: Simple troubleshooting text.
     Expected: Should extract as TROUBLESHOOTING category.
     """
-    print("\n" + "=" * 80)
-    print("TEST 1: Simple Troubleshooting Text")
-    print("=" * 80)
-
-    orchestrator = KBOrchestrator()
+    print("\n" + "=" * 80, file=out)
+    print("TEST 1: Simple Troubleshooting Text", file=out)
+    print("=" * 80, file=out)
 
     text = """
     We had an issue with API timeout errors in production. The API calls to the
@@ -60,14 +77,14 @@ async def test_text_to_kb_simple():
         metadata={"test": "simple_troubleshooting"},
     )
 
-    print(f"\n✅ Result:")
-    print(f"  Status: {result.status}")
-    print(f"  Action: {result.action}")
-    print(f"  Title: {result.kb_document_title}")
-    print(f"  Category: {result.kb_category}")
-    print(f"  Confidence: {result.ai_confidence}")
-    print(f"  Summary: {result.kb_summary}")
-    print(f"  Reasoning: {result.ai_reasoning[:100]}...")
+    print(f"\n✅ Result:", file=out)
+    print(f"  Status: {result.status}", file=out)
+    print(f"  Action: {result.action}", file=out)
+    print(f"  Title: {result.kb_document_title}", file=out)
+    print(f"  Category: {result.kb_category}", file=out)
+    print(f"  Confidence: {result.ai_confidence}", file=out)
+    print(f"  Summary: {result.kb_summary}", file=out)
+    print(f"  Reasoning: {result.ai_reasoning[:100]}...", file=out)
 
     assert result.status == "success", f"Expected success, got {result.status}"
     assert result.action in [
@@ -85,16 +102,16 @@ async def test_text_to_kb_simple():
     return result
 
 
-async def test_text_to_kb_process():
+async def test_text_to_kb_process(
+    orchestrator: KBOrchestrator, out: Optional[TextIO] = None
+):
     """
     Test Case 2: Process documentation.
     Expected: Should extract as PROCESSES category.
     """
-    print("\n" + "=" * 80)
-    print("TEST 2: Process Documentation")
-    print("=" * 80)
-
-    orchestrator = KBOrchestrator()
+    print("\n" + "=" * 80, file=out)
+    print("TEST 2: Process Documentation", file=out)
+    print("=" * 80, file=out)
 
     text = """
     Here's our standard procedure for deploying to production:
@@ -117,13 +134,13 @@ async def test_text_to_kb_process():
         metadata={"test": "process_documentation"},
     )
 
-    print(f"\n✅ Result:")
-    print(f"  Status: {result.status}")
-    print(f"  Action: {result.action}")
-    print(f"  Title: {result.kb_document_title}")
-    print(f"  Category: {result.kb_category}")
-    print(f"  Confidence: {result.ai_confidence}")
-    print(f"  Summary: {result.kb_summary}")
+    print(f"\n✅ Result:", file=out)
+    print(f"  Status: {result.status}", file=out)
+    print(f"  Action: {result.action}", file=out)
+    print(f"  Title: {result.kb_document_title}", file=out)
+    print(f"  Category: {result.kb_category}", file=out)
+    print(f"  Confidence: {result.ai_confidence}", file=out)
+    print(f"  Summary: {result.kb_summary}", file=out)
 
     assert result.status == "success", f"Expected success, got {result.status}"
     assert result.action in [
@@ -137,16 +154,16 @@ async def test_text_to_kb_process():
     return result
 
 
-async def test_text_to_kb_with_pii():
+async def test_text_to_kb_with_pii(
+    orchestrator: KBOrchestrator, out: Optional[TextIO] = None
+):
     """
     Test Case 3: Text with PII data.
     Expected: Should mask PII before extraction.
     """
-    print("\n" + "=" * 80)
-    print("TEST 3: Text with PII Data")
-    print("=" * 80)
-
-    orchestrator = KBOrchestrator()
+    print("\n" + "=" * 80, file=out)
+    print("TEST 3: Text with PII Data", file=out)
+    print("=" * 80, file=out)
 
     text = """
     John Doe (john.doe@company.com) reported an issue with the database connection.
@@ -165,29 +182,29 @@ async def test_text_to_kb_with_pii():
         metadata={"test": "pii_masking"},
     )
 
-    print(f"\n✅ Result:")
-    print(f"  Status: {result.status}")
-    print(f"  Action: {result.action}")
-    print(f"  Title: {result.kb_document_title}")
-    print(f"  Category: {result.kb_category}")
-    print(f"  Confidence: {result.ai_confidence}")
+    print(f"\n✅ Result:", file=out)
+    print(f"  Status: {result.status}", file=out)
+    print(f"  Action: {result.action}", file=out)
+    print(f"  Title: {result.kb_document_title}", file=out)
+    print(f"  Category: {result.kb_category}", file=out)
+    print(f"  Confidence: {result.ai_confidence}", file=out)
 
     assert result.status == "success", f"Expected success, got {result.status}"
-    print("\n  ✓ PII masking completed (names, emails, IDs should be masked)")
+    print("\n  ✓ PII masking completed (names, emails, IDs should be masked)", file=out)
 
     return result
 
 
-async def test_insufficient_content():
+async def test_insufficient_content(
+    orchestrator: KBOrchestrator, out: Optional[TextIO] = None
+):
     """
     Test Case 4: Insufficient content.
     Expected: Should return IGNORE action with helpful message.
     """
-    print("\n" + "=" * 80)
-    print("TEST 4: Insufficient Content")
-    print("=" * 80)
-
-    orchestrator = KBOrchestrator()
+    print("\n" + "=" * 80, file=out)
+    print("TEST 4: Insufficient Content", file=out)
+    print("=" * 80, file=out)
 
     text = "Hi"  # Too short
 
@@ -197,29 +214,29 @@ async def test_insufficient_content():
         metadata={"test": "insufficient_content"},
     )
 
-    print(f"\n✅ Result:")
-    print(f"  Status: {result.status}")
-    print(f"  Action: {result.action}")
-    print(f"  Reason: {result.reason}")
+    print(f"\n✅ Result:", file=out)
+    print(f"  Status: {result.status}", file=out)
+    print(f"  Action: {result.action}", file=out)
+    print(f"  Reason: {result.reason}", file=out)
 
     assert result.status == "success", f"Expected success, got {result.status}"
     assert result.action == KBActionType.IGNORE, f"Expected IGNORE, got {result.action}"
     assert result.reason is not None, "Should have a reason for IGNORE"
-    print("\n  ✓ Correctly identified insufficient content")
+    print("\n  ✓ Correctly identified insufficient content", file=out)
 
     return result
 
 
-async def test_decision_documentation():
+async def test_decision_documentation(
+    orchestrator: KBOrchestrator, out: Optional[TextIO] = None
+):
     """
     Test Case 5: Decision documentation.
     Expected: Should extract as DECISIONS category.
     """
-    print("\n" + "=" * 80)
-    print("TEST 5: Decision Documentation")
-    print("=" * 80)
-
-    orchestrator = KBOrchestrator()
+    print("\n" + "=" * 80, file=out)
+    print("TEST 5: Decision Documentation", file=out)
+    print("=" * 80, file=out)
 
     text = """
     We discussed whether to use PostgreSQL or MongoDB for our new analytics service.
@@ -242,13 +259,13 @@ async def test_decision_documentation():
         metadata={"test": "decision_documentation"},
     )
 
-    print(f"\n✅ Result:")
-    print(f"  Status: {result.status}")
-    print(f"  Action: {result.action}")
-    print(f"  Title: {result.kb_document_title}")
-    print(f"  Category: {result.kb_category}")
-    print(f"  Confidence: {result.ai_confidence}")
-    print(f"  Summary: {result.kb_summary}")
+    print(f"\n✅ Result:", file=out)
+    print(f"  Status: {result.status}", file=out)
+    print(f"  Action: {result.action}", file=out)
+    print(f"  Title: {result.kb_document_title}", file=out)
+    print(f"  Category: {result.kb_category}", file=out)
+    print(f"  Confidence: {result.ai_confidence}", file=out)
+    print(f"  Summary: {result.kb_summary}", file=out)
 
     assert result.status == "success", f"Expected success, got {result.status}"
 
@@ -265,9 +282,7 @@ async def main():
     print("Testing with Real LLM Requests")
     print("=" * 80)
 
-    start_time = datetime.now()
-    results = []
-    failed_tests = []
+    start_ns = time.perf_counter_ns()
 
     # Run tests
     tests = [
@@ -278,29 +293,50 @@ async def main():
         ("Decision Documentation", test_decision_documentation),
     ]
 
-    for test_name, test_func in tests:
+    # Build the orchestrator (LLM, masking and GitHub clients) once for all tests
+    try:
+        orchestrator = KBOrchestrator()
+    except Exception as e:
+        logger.error(f"Failed to initialize KBOrchestrator: {str(e)}", exc_info=True)
+        print(f"\n❌ Could not initialize KBOrchestrator: {e}")
+        return 1
+
+    async def _wrap(test_name, test_func):
+        report = io.StringIO()
         try:
-            result = await test_func()
-            results.append((test_name, "PASS", result))
+            result = await test_func(orchestrator, out=report)
+            return test_name, "PASS", result, report
         except Exception as e:
-            logger.error(f"Test {test_name} failed: {str(e)}", exc_info=True)
-            results.append((test_name, "FAIL", str(e)))
-            failed_tests.append(test_name)
+            return test_name, "FAIL", e, report
+
+    # Tests are independent, so overlap their LLM round-trips. _wrap turns every
+    # test failure into a FAIL row, so gather() never sees an exception and
+    # return_exceptions is not needed. gather() keeps submission order, so each
+    # report is printed after the run in test order rather than as tests finish.
+    results = await asyncio.gather(
+        *(_wrap(test_name, test_func) for test_name, test_func in tests)
+    )
+    for test_name, status, payload, report in results:
+        sys.stdout.write(report.getvalue())
+        if status == "FAIL":
+            logger.error(f"Test {test_name} failed: {payload}", exc_info=payload)
+    failed_tests = [
+        test_name for test_name, status, _, _ in results if status == "FAIL"
+    ]
 
     # Summary
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
 
     print("\n" + "=" * 80)
     print("TEST SUMMARY")
     print("=" * 80)
 
-    for test_name, status, result in results:
+    for test_name, status, _, _ in results:
         icon = "✅" if status == "PASS" else "❌"
         print(f"{icon} {test_name}: {status}")
 
     print(f"\nTotal Tests: {len(tests)}")
-    print(f"Passed: {len([r for r in results if r[1] == 'PASS'])}")
+    print(f"Passed: {sum(1 for _, status, _, _ in results if status == 'PASS')}")
     print(f"Failed: {len(failed_tests)}")
     print(f"Duration: {duration:.2f}s")
 
@@ -313,5 +349,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     exit(exit_code)
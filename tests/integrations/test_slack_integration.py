@@ -12,6 +12,8 @@ Usage:
     python tests/integrations/test_slack_integration.py --real      # Real Slack API
     python tests/integrations/test_slack_integration.py --quick     # Quick test
     python tests/integrations/test_slack_integration.py --list-channels  # List channels
+    pytest tests/integrations/test_slack_integration.py             # Mock tests via pytest
+    ARCHIE_REAL=1 pytest tests/integrations/test_slack_integration.py  # ...plus real API
 
 Requirements for --real mode:
 - SLACK_BOT_TOKEN in .env
@@ -27,12 +29,19 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
+import argparse
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
-from unittest.mock import AsyncMock, MagicMock
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 
+import pytest
+
+import app.services  # noqa: F401 - load services first to break the slack<->services import cycle
 from app.integrations.slack.client import SlackClient
 from app.models.thread import (
     StandardizedConversation,
@@ -91,12 +100,27 @@ MOCK_THREAD_DATA = {
     ]
 }
 
-EXPECTED_MESSAGE_ORDER = [
+
+def _freeze(payload: Any) -> Any:
+    """Recursively make mock payloads read-only (dicts -> mapping proxies, lists -> tuples)."""
+    if isinstance(payload, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in payload.items()})
+    if isinstance(payload, list):
+        return tuple(_freeze(item) for item in payload)
+    return payload
+
+
+# Mock payloads are read-only so they can be shared by reference without copying
+MOCK_HISTORY_DATA = _freeze(MOCK_HISTORY_DATA)
+MOCK_THREAD_DATA = _freeze(MOCK_THREAD_DATA)
+_MOCK_RESPONSES = (MOCK_HISTORY_DATA, MOCK_THREAD_DATA)
+
+EXPECTED_MESSAGE_ORDER = (
     "Hey team, I need help with the new feature implementation",
     "I can help! Let me take a look at the requirements",
     "Thanks both! I'll update the documentation once it's ready",
     "Quick update: The deployment went smoothly",
-]
+)
 
 
 # ============================================================================
@@ -104,7 +128,12 @@ EXPECTED_MESSAGE_ORDER = [
 # ============================================================================
 
 
-@dataclass
+# Accepted --from/--to formats: a date, or a full timestamp
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass(slots=True, frozen=True)
 class TestConfig:
     """Test configuration settings."""
 
@@ -112,6 +141,13 @@ class TestConfig:
     limit: Optional[int] = 10
     from_datetime: Optional[datetime] = None
     to_datetime: Optional[datetime] = None
+    from_timestamp: Optional[int] = None  # from_datetime as epoch seconds
+
+    def __post_init__(self):
+        if self.from_timestamp is None and self.from_datetime is not None:
+            object.__setattr__(
+                self, "from_timestamp", int(self.from_datetime.timestamp())
+            )
 
     def has_time_filter(self) -> bool:
         return self.from_datetime is not None or self.to_datetime is not None
@@ -120,7 +156,7 @@ class TestConfig:
         return self.verbose or self.has_time_filter() or self.limit != 10
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Test execution result."""
 
@@ -129,7 +165,7 @@ class TestResult:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance timing metrics."""
 
@@ -143,13 +179,31 @@ class PerformanceMetrics:
 # ============================================================================
 
 
+# Divider lines at the default width, built once
+_DIVIDERS = {("=", 60): "=" * 60, ("-", 60): "-" * 60}
+
+# C-level accessors for the message index fields scanned in verbose output
+_get_idx = attrgetter("idx")
+_get_parent_idx = attrgetter("parent_idx")
+
+
+@lru_cache(maxsize=None)
+def _model_fields(model: type) -> frozenset:
+    """Return a pydantic model's field names, computed once per model."""
+    return frozenset(model.model_fields)
+
+
+# Width of the dot-padded test name column in print_test_status
+STATUS_COLUMN_WIDTH = 46
+
+
 class TestOutputFormatter:
     """Handles all test output formatting."""
 
     @staticmethod
     def print_divider(char: str = "=", length: int = 60):
         """Print a shorter divider line."""
-        print(char * length)
+        print(_DIVIDERS.get((char, length)) or char * length)
 
     @staticmethod
     def print_header(title: str, emoji: str = "📋"):
@@ -160,8 +214,8 @@ class TestOutputFormatter:
     def print_test_status(test_name: str, passed: bool, details: str = None):
         """Print aligned test status."""
         status = "✅ PASS" if passed else "❌ FAIL"
-        dots = "." * (45 - len(test_name))
-        print(f"  {test_name} {dots} {status}")
+        label = f"{test_name} ".ljust(STATUS_COLUMN_WIDTH, ".")
+        print(f"  {label} {status}")
         if details:
             print(f"      → {details}")
 
@@ -181,11 +235,10 @@ class TestOutputFormatter:
             if config.from_datetime and config.to_datetime:
                 config_parts.append("date range")
             elif config.from_datetime:
-                days_ago = (datetime.now() - config.from_datetime).days
+                elapsed_seconds = int(time.time()) - config.from_timestamp
+                days_ago = elapsed_seconds // 86400
                 if days_ago == 0:
-                    hours_ago = int(
-                        (datetime.now() - config.from_datetime).total_seconds() / 3600
-                    )
+                    hours_ago = elapsed_seconds // 3600
                     config_parts.append(f"last {hours_ago}h")
                 else:
                     config_parts.append(f"last {days_ago}d")
@@ -205,9 +258,10 @@ class TestOutputFormatter:
         print("📊 CONVERSATION EXTRACTION RESULTS:")
 
         for i, msg in enumerate(conversation.messages, 1):
-            user_display = user_mapping.get(
-                msg.author_id, f"USER_{len(user_mapping) + 1}"
-            )
+            user_display = user_mapping.get(msg.author_id)
+            if user_display is None:
+                # Only format the fallback label for unmapped authors
+                user_display = f"USER_{len(user_mapping) + 1}"
             timestamp_str = msg.timestamp.strftime("%Y-%m-%d %H:%M:%S")
             preview = msg.content[:60] + "..." if len(msg.content) > 60 else msg.content
 
@@ -228,22 +282,23 @@ class TestOutputFormatter:
         print(f"📝 CONVERSATION DETAILS:")
         print(f"   → ID: {conversation.id}")
         print(f"   → Source: {conversation.source.type.value}")
-        print(
-            f"   → Category: {getattr(conversation.category, 'value', 'None') if hasattr(conversation, 'category') and conversation.category else 'None'}"
-        )
+        category = getattr(conversation, "category", None)
+        category_label = getattr(category, "value", "None") if category else "None"
+        print(f"   → Category: {category_label}")
         print(f"   → Messages: {len(conversation.messages)}")
         print(f"   → Participants: {conversation.participant_count}")
 
         # Check global indexing
-        indices = [msg.idx for msg in conversation.messages]
+        indices = list(map(_get_idx, conversation.messages))
         print(f"   → Message indices: {indices}")
 
         # Check thread structure
-        thread_messages = [
-            msg for msg in conversation.messages if msg.parent_idx is not None
-        ]
-        if thread_messages:
-            print(f"   → Thread replies: {len(thread_messages)}")
+        reply_count = sum(
+            parent_idx is not None
+            for parent_idx in map(_get_parent_idx, conversation.messages)
+        )
+        if reply_count:
+            print(f"   → Thread replies: {reply_count}")
 
     @staticmethod
     def print_performance_breakdown(metrics: PerformanceMetrics):
@@ -271,27 +326,44 @@ class TestOutputFormatter:
                     print(f"   • {result.name}: {result.message}")
 
 
+# All formatter methods are static, so one shared instance serves every test
+_FORMATTER = TestOutputFormatter()
+
+
 class PerformanceTracker:
-    """Tracks and manages performance timing."""
+    """Tracks and manages performance timing.
 
-    def __init__(self):
-        self.start_time = time.time()
+    When disabled, no clock is read and finalize() returns zeroed metrics.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.start_time = time.perf_counter_ns() if enabled else 0
         self.metrics = PerformanceMetrics()
 
     def start_extraction(self):
-        self.extraction_start = time.time()
+        if self.enabled:
+            self.extraction_start = time.perf_counter_ns()
 
     def end_extraction(self):
-        self.metrics.extraction_time = time.time() - self.extraction_start
+        if self.enabled:
+            self.metrics.extraction_time = (
+                time.perf_counter_ns() - self.extraction_start
+            ) / 1e9
 
     def start_conversion(self):
-        self.conversion_start = time.time()
+        if self.enabled:
+            self.conversion_start = time.perf_counter_ns()
 
     def end_conversion(self):
-        self.metrics.conversion_time = time.time() - self.conversion_start
+        if self.enabled:
+            self.metrics.conversion_time = (
+                time.perf_counter_ns() - self.conversion_start
+            ) / 1e9
 
     def finalize(self):
-        self.metrics.total_time = time.time() - self.start_time
+        if self.enabled:
+            self.metrics.total_time = (time.perf_counter_ns() - self.start_time) / 1e9
         return self.metrics
 
 
@@ -313,29 +385,27 @@ class SlackTestClient:
         self, conversation: StandardizedConversation
     ) -> Dict[str, str]:
         """Create user mapping for display purposes."""
-        user_mapping = {}
-        user_counter = 1
-
-        for msg in conversation.messages:
-            if msg.author_id not in user_mapping:
-                user_mapping[msg.author_id] = f"USER_{user_counter}"
-                user_counter += 1
-
-        return user_mapping
+        # dict.fromkeys dedupes author IDs in first-seen order
+        unique_author_ids = dict.fromkeys(
+            msg.author_id for msg in conversation.messages
+        )
+        return {
+            author_id: f"USER_{i}" for i, author_id in enumerate(unique_author_ids, 1)
+        }
 
 
 class MockDataFactory:
     """Factory for creating mock test data."""
 
     @staticmethod
-    def create_mock_responses() -> Tuple[dict, dict]:
-        """Create mock Slack API responses."""
-        return MOCK_HISTORY_DATA, MOCK_THREAD_DATA
+    def create_mock_responses() -> Tuple[Mapping[str, Any], Mapping[str, Any]]:
+        """Create mock Slack API responses (read-only, shared)."""
+        return _MOCK_RESPONSES
 
     @staticmethod
-    def get_expected_message_order() -> List[str]:
-        """Get expected message order after thread expansion."""
-        return EXPECTED_MESSAGE_ORDER.copy()
+    def get_expected_message_order() -> Tuple[str, ...]:
+        """Get expected message order after thread expansion (read-only, shared)."""
+        return EXPECTED_MESSAGE_ORDER
 
 
 # ============================================================================
@@ -346,9 +416,9 @@ class MockDataFactory:
 class BaseSlackTest:
     """Base class for Slack integration tests."""
 
-    def __init__(self):
-        self.formatter = TestOutputFormatter()
-        self.tracker = PerformanceTracker()
+    def __init__(self, track_performance: bool = True):
+        self.formatter = _FORMATTER
+        self.tracker = PerformanceTracker(enabled=track_performance)
 
     def _validate_credentials(self) -> bool:
         """Validate required credentials."""
@@ -368,6 +438,75 @@ class BaseSlackTest:
 class MockSlackTest(BaseSlackTest):
     """Tests using mock data."""
 
+    # Mock conversation shared by every run; the tests only read it
+    _cached_conversation: Optional[StandardizedConversation] = None
+
+    def __init__(self):
+        # Mock tests never report timings
+        super().__init__(track_performance=False)
+        self._client: Optional[SlackTestClient] = None
+
+    @property
+    def client(self) -> SlackTestClient:
+        """SlackTestClient shared by the mock tests, created on first use."""
+        if self._client is None:
+            self._client = SlackTestClient()
+        return self._client
+
+    @classmethod
+    def _build_mock_conversation(cls) -> StandardizedConversation:
+        """Build the mock StandardizedConversation once and reuse it across runs."""
+        if cls._cached_conversation is not None:
+            return cls._cached_conversation
+
+        mock_history, mock_thread = MockDataFactory.create_mock_responses()
+        thread_size = len(mock_thread["messages"])
+
+        # Thread messages first (maintaining thread structure), then standalone
+        # messages, skipping the first history entry (it's the thread root)
+        source_messages = tuple(
+            chain(mock_thread["messages"], islice(mock_history["messages"], 1, None))
+        )
+        # Split the payload into ts/text/user columns, then convert the "ts"
+        # column in one mapped pass rather than per message
+        ts_column, text_column, user_column = zip(
+            *map(itemgetter("ts", "text", "user"), source_messages)
+        )
+        timestamps = map(datetime.fromtimestamp, map(float, ts_column))
+        # Mock data is valid by construction, so skip pydantic validation
+        messages = [
+            StandardizedMessage.model_construct(
+                id=ts,  # Add required id field
+                idx=idx,
+                # First thread message is root, other thread messages reply to it
+                parent_idx=0 if 0 < idx < thread_size else None,
+                content=text,
+                author_id=user,
+                author_name=f"USER_{idx + 1}",
+                timestamp=timestamp,
+                message_id=ts,
+            )
+            for idx, (ts, text, user, timestamp) in enumerate(
+                zip(ts_column, text_column, user_column, timestamps)
+            )
+        ]
+
+        now = datetime.now()
+        cls._cached_conversation = StandardizedConversation.model_construct(
+            id="mock_conversation_123",
+            source=Source(
+                type=SourceType.SLACK,
+                channel_id="C1234567890",
+                channel_name="test-channel",
+            ),
+            messages=messages,
+            participant_count=3,
+            category=ConversationCategory.TROUBLESHOOTING,
+            created_at=now,
+            last_activity_at=now,
+        )
+        return cls._cached_conversation
+
     async def test_conversation_structure(
         self, config: TestConfig = None
     ) -> TestResult:
@@ -376,69 +515,15 @@ class MockSlackTest(BaseSlackTest):
             config = TestConfig()
 
         try:
-            client = SlackTestClient()
-            mock_history, mock_thread = MockDataFactory.create_mock_responses()
-
+            client = self.client
             # Setup mocks
-            original_fetch = client.client.fetch_conversations_with_threads
-
             async def mock_fetch(*args, **kwargs):
-                # Create mock StandardizedConversation
-                messages = []
-                idx = 0
-
-                # Add thread messages first (maintaining thread structure)
-                for msg_data in mock_thread["messages"]:
-                    message = StandardizedMessage(
-                        id=msg_data["ts"],  # Add required id field
-                        idx=idx,
-                        parent_idx=(
-                            0 if idx > 0 else None
-                        ),  # First message is root, others are replies
-                        content=msg_data["text"],
-                        author_id=msg_data["user"],
-                        author_name=f"USER_{idx + 1}",
-                        timestamp=datetime.fromtimestamp(float(msg_data["ts"])),
-                        message_id=msg_data["ts"],
-                    )
-                    messages.append(message)
-                    idx += 1
-
-                # Add standalone messages
-                for msg_data in mock_history["messages"][
-                    1:
-                ]:  # Skip first one (it's the thread root)
-                    message = StandardizedMessage(
-                        id=msg_data["ts"],  # Add required id field
-                        idx=idx,
-                        parent_idx=None,
-                        content=msg_data["text"],
-                        author_id=msg_data["user"],
-                        author_name=f"USER_{idx + 1}",
-                        timestamp=datetime.fromtimestamp(float(msg_data["ts"])),
-                        message_id=msg_data["ts"],
-                    )
-                    messages.append(message)
-                    idx += 1
-
-                return StandardizedConversation(
-                    id="mock_conversation_123",
-                    source=Source(
-                        type=SourceType.SLACK,
-                        channel_id="C1234567890",
-                        channel_name="test-channel",
-                    ),
-                    messages=messages,
-                    participant_count=3,
-                    category=ConversationCategory.TROUBLESHOOTING,
-                    created_at=datetime.now(),
-                    last_activity_at=datetime.now(),
-                )
-
-            # Apply mock
-            client.client.fetch_conversations_with_threads = mock_fetch
+                return self._build_mock_conversation()
 
             try:
+                # Apply mock as an instance attribute shadowing the class method
+                client.client.fetch_conversations_with_threads = mock_fetch
+
                 # Test conversation fetching
                 conversation = await client.fetch_with_config(config)
 
@@ -449,51 +534,62 @@ class MockSlackTest(BaseSlackTest):
                     self.formatter.print_conversation_details(conversation)
 
                 # Verify results
+                messages = conversation.messages
                 has_id = conversation.id is not None
-                has_global_indexing = all(
-                    msg.idx is not None for msg in conversation.messages
-                )
-                has_thread_structure = any(
-                    msg.parent_idx is not None for msg in conversation.messages
-                )
+
+                # Collect indexing, threading and order facts in one pass
+                has_global_indexing = True
+                has_thread_structure = False
+                contents = []
+                for msg in messages:
+                    if msg.idx is None:
+                        has_global_indexing = False
+                    if msg.parent_idx is not None:
+                        has_thread_structure = True
+                    contents.append(msg.content)
+
                 correct_source = conversation.source.type == SourceType.SLACK
-                correct_message_count = len(conversation.messages) >= 3
-
-                success = all(
-                    [
-                        has_id,
-                        has_global_indexing,
-                        has_thread_structure,
-                        correct_source,
-                        correct_message_count,
-                    ]
+                correct_message_count = len(messages) >= 3
+                # Thread replies follow their root, then standalone messages
+                correct_order = (
+                    tuple(contents) == MockDataFactory.get_expected_message_order()
                 )
 
-                details = []
-                if not has_id:
-                    details.append("missing conversation ID")
-                if not has_global_indexing:
-                    details.append("missing global indexing")
-                if not has_thread_structure:
-                    details.append("no thread structure detected")
-                if not correct_source:
-                    details.append("incorrect source type")
-                if not correct_message_count:
-                    details.append("insufficient messages")
-
-                return TestResult(
-                    "Conversation Structure",
-                    success,
-                    (
-                        "; ".join(details)
-                        if details
-                        else f"✅ ID, indexing, threads, {len(conversation.messages)} messages"
-                    ),
+                success = (
+                    has_id
+                    and has_global_indexing
+                    and has_thread_structure
+                    and correct_source
+                    and correct_message_count
+                    and correct_order
                 )
 
+                if success:
+                    # Common all-pass path: no failure details to collect
+                    message = (
+                        f"✅ ID, indexing, threads, order, {len(messages)} messages"
+                    )
+                else:
+                    details = []
+                    if not has_id:
+                        details.append("missing conversation ID")
+                    if not has_global_indexing:
+                        details.append("missing global indexing")
+                    if not has_thread_structure:
+                        details.append("no thread structure detected")
+                    if not correct_source:
+                        details.append("incorrect source type")
+                    if not correct_message_count:
+                        details.append("insufficient messages")
+                    if not correct_order:
+                        details.append("unexpected message order")
+                    message = "; ".join(details)
+
+                return TestResult("Conversation Structure", success, message)
+
             finally:
-                # Restore original method
-                client.client.fetch_conversations_with_threads = original_fetch
+                # Restore original method by dropping the instance override
+                vars(client.client).pop("fetch_conversations_with_threads", None)
 
         except Exception as e:
             return TestResult("Conversation Structure", False, f"Exception: {e}")
@@ -504,32 +600,23 @@ class MockSlackTest(BaseSlackTest):
             config = TestConfig()
 
         try:
-            # Verify SlackClient doesn't have masking methods
-            client = SlackTestClient()
-
-            has_no_masking = not hasattr(client.client, "mask_messages")
-            has_fetch_method = hasattr(
-                client.client, "fetch_conversations_with_threads"
-            )
+            # Verify SlackClient doesn't have masking methods (class-level check,
+            # no client instantiation needed)
+            has_no_masking = not hasattr(SlackClient, "mask_messages")
+            has_fetch_method = hasattr(SlackClient, "fetch_conversations_with_threads")
 
             # Verify StandardizedConversation has required fields
-            from app.models.thread import StandardizedConversation, StandardizedMessage
-
-            conversation_fields = StandardizedConversation.model_fields.keys()
-            message_fields = StandardizedMessage.model_fields.keys()
-
-            has_conversation_id = "id" in conversation_fields
+            has_conversation_id = "id" in _model_fields(StandardizedConversation)
+            message_fields = _model_fields(StandardizedMessage)
             has_message_indexing = (
                 "idx" in message_fields and "parent_idx" in message_fields
             )
 
-            success = all(
-                [
-                    has_no_masking,
-                    has_fetch_method,
-                    has_conversation_id,
-                    has_message_indexing,
-                ]
+            success = (
+                has_no_masking
+                and has_fetch_method
+                and has_conversation_id
+                and has_message_indexing
             )
 
             details = []
@@ -608,7 +695,7 @@ class SlackTestRunner:
     """Main test runner."""
 
     def __init__(self):
-        self.formatter = TestOutputFormatter()
+        self.formatter = _FORMATTER
 
     async def run_tests(self, test_mode: str, config: TestConfig) -> List[TestResult]:
         """Run tests based on mode."""
@@ -640,26 +727,23 @@ class SlackTestRunner:
             config = TestConfig()
 
         mock_test = MockSlackTest()
-        results = []
 
         # Conversation structure test
-        structure_result = await mock_test.test_conversation_structure(config)
-        self.formatter.print_test_status(
-            "Conversation Structure", structure_result.passed, structure_result.message
-        )
-        results.append(structure_result)
+        selected = [("Conversation Structure", mock_test.test_conversation_structure)]
 
         if test_mode != "quick":
             # Clean architecture test
-            architecture_result = await mock_test.test_clean_architecture(config)
-            self.formatter.print_test_status(
-                "Clean Architecture",
-                architecture_result.passed,
-                architecture_result.message,
-            )
-            results.append(architecture_result)
+            selected.append(("Clean Architecture", mock_test.test_clean_architecture))
 
-        return results
+        # Only the structure test patches the shared client's fetch method (the
+        # architecture test just inspects it), so they can run concurrently;
+        # results are printed afterwards so status lines don't interleave
+        results = await asyncio.gather(*(test(config) for _, test in selected))
+
+        for (name, _), result in zip(selected, results):
+            self.formatter.print_test_status(name, result.passed, result.message)
+
+        return list(results)
 
     async def _run_real_tests(self, config: TestConfig) -> List[TestResult]:
         """Run real API tests."""
@@ -693,6 +777,41 @@ class SlackTestRunner:
             print(f"❌ Error: {e}")
 
 
+# ============================================================================
+# Pytest Entry Points
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def mock_slack_test() -> MockSlackTest:
+    """MockSlackTest (and its SlackTestClient) shared by all mock tests."""
+    test = MockSlackTest()
+    if not test._validate_credentials():
+        pytest.skip("SLACK_BOT_TOKEN is required to construct SlackClient")
+    return test
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "test_method", ["test_conversation_structure", "test_clean_architecture"]
+)
+async def test_mock_slack(mock_slack_test: MockSlackTest, test_method: str):
+    """Run a mock-data Slack test through pytest."""
+    result = await getattr(mock_slack_test, test_method)(TestConfig())
+    assert result.passed, result.message
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not os.getenv("ARCHIE_REAL"),
+    reason="Set ARCHIE_REAL=1 to run against the real Slack API",
+)
+async def test_real_slack():
+    """Run the real Slack API test through pytest."""
+    result = await RealSlackTest().test_real_integration(TestConfig())
+    assert result.passed, result.message
+
+
 # ============================================================================
 # Configuration Parser
 # ============================================================================
@@ -701,10 +820,27 @@ class SlackTestRunner:
 class ConfigParser:
     """Parse command line arguments into test configuration."""
 
+    # Bare flags that need no option values; when the command line holds only
+    # these, the mode can be read straight from sys.argv without argparse.
+    # Listed in precedence order (--real is left to argparse for its options)
+    _MODE_FLAGS = {"--quick": "quick", "--list-channels": "list-channels"}
+    _FAST_PATH_FLAGS = frozenset(("--mock", "--verbose", "-v", *_MODE_FLAGS))
+
     @staticmethod
     def parse_args() -> Tuple[str, TestConfig]:
         """Parse command line arguments."""
-        import argparse
+        argv = sys.argv[1:]
+        if ConfigParser._FAST_PATH_FLAGS.issuperset(argv):
+            test_mode = next(
+                (
+                    mode
+                    for flag, mode in ConfigParser._MODE_FLAGS.items()
+                    if flag in argv
+                ),
+                "mock",
+            )
+            verbose = "--verbose" in argv or "-v" in argv
+            return test_mode, TestConfig(verbose=verbose)
 
         parser = argparse.ArgumentParser(
             description="Test Slack Integration with Clean Architecture",
@@ -789,59 +925,86 @@ Examples:
     @staticmethod
     def _create_test_config(args, test_mode: str) -> TestConfig:
         """Create test configuration from arguments."""
-        config = TestConfig(verbose=args.verbose)
-
         if test_mode != "real":
-            return config
+            return TestConfig(verbose=args.verbose)
 
         # Handle message limits
+        limit = 10
         if args.no_limit:
-            config.limit = None
+            limit = None
         elif args.limit:
-            config.limit = args.limit
-        # else: keep default limit = 10
-
-        # Handle time ranges
-        now = datetime.now()
+            limit = args.limit
+
+        # Handle time ranges (--hours wins over --days, which wins over --from)
+        lookback = next(
+            (
+                timedelta(**{unit: amount})
+                for unit, amount in (("hours", args.hours), ("days", args.days))
+                if amount
+            ),
+            None,
+        )
+        from_datetime = None
+        to_datetime = None
 
-        if args.hours:
-            config.from_datetime = now - timedelta(hours=args.hours)
-        elif args.days:
-            config.from_datetime = now - timedelta(days=args.days)
+        if lookback is not None:
+            # Only read the clock when a relative window was requested
+            from_datetime = datetime.now() - lookback
         elif args.from_date:
-            config.from_datetime = ConfigParser._parse_datetime(args.from_date, "from")
+            from_datetime = ConfigParser._parse_datetime(args.from_date, "from")
 
         if args.to_date:
-            config.to_datetime = ConfigParser._parse_datetime(
+            to_datetime = ConfigParser._parse_datetime(
                 args.to_date, "to", end_of_day=True
             )
 
-        return config
+        return TestConfig(
+            verbose=args.verbose,
+            limit=limit,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+        )
 
     @staticmethod
     def _parse_datetime(
         date_str: str, field_name: str, end_of_day: bool = False
     ) -> datetime:
         """Parse datetime string."""
+        has_time = len(date_str) > 10
         try:
-            if len(date_str) > 10:
-                return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-            else:
-                base_date = datetime.strptime(date_str, "%Y-%m-%d")
-                if end_of_day:
-                    return base_date.replace(hour=23, minute=59, second=59)
-                return base_date
+            parsed = datetime.strptime(
+                date_str, DATETIME_FORMAT if has_time else DATE_FORMAT
+            )
         except ValueError:
             print(f"❌ Invalid --{field_name} date format: {date_str}")
             print("   Use: YYYY-MM-DD or 'YYYY-MM-DD HH:MM:SS'")
             sys.exit(1)
 
+        if end_of_day and not has_time:
+            return parsed.replace(hour=23, minute=59, second=59)
+        return parsed
+
 
 # ============================================================================
 # Main Function
 # ============================================================================
 
 
+# Usage examples printed after each run ({script} is the invoked script path)
+USAGE_EXAMPLES = """
+💡 Test mode examples:
+   python {script} --mock                           # Mock data testing
+   python {script} --real --verbose                 # Real API with details
+   python {script} --real --limit 25                # Real API, 25 messages
+   python {script} --real --days 7 --verbose        # Last 7 days, detailed
+   python {script} --real --hours 24                # Last 24 hours
+   python {script} --real --from 2026-02-01         # From specific date
+   python {script} --quick                          # Quick mock test
+   python {script} --list-channels                  # List channels
+
+"""
+
+
 async def main():
     """Main test execution function."""
     test_mode, config = ConfigParser.parse_args()
@@ -852,26 +1015,16 @@ async def main():
     results = await runner.run_tests(test_mode, config)
 
     # Print usage examples
-    print(f"\n💡 Test mode examples:")
-    print(
-        f"   python {sys.argv[0]} --mock                           # Mock data testing"
-    )
-    print(
-        f"   python {sys.argv[0]} --real --verbose                 # Real API with details"
-    )
-    print(
-        f"   python {sys.argv[0]} --real --limit 25                # Real API, 25 messages"
-    )
-    print(
-        f"   python {sys.argv[0]} --real --days 7 --verbose        # Last 7 days, detailed"
-    )
-    print(f"   python {sys.argv[0]} --real --hours 24                # Last 24 hours")
-    print(
-        f"   python {sys.argv[0]} --real --from 2026-02-01         # From specific date"
-    )
-    print(f"   python {sys.argv[0]} --quick                          # Quick mock test")
-    print(f"   python {sys.argv[0]} --list-channels                  # List channels\n")
+    sys.stdout.write(USAGE_EXAMPLES.format(script=sys.argv[0]))
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed (optional)
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -0,0 +1,64 @@
+"""
+Test KBOrchestrator text input handling
+"""
+
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+import asyncio
+from app.services.kb_orchestrator import KBOrchestrator, MIN_TEXT_CHARS
+from app.models.api_responses import KBActionType
+
+
+class TestProcessTextInput(unittest.TestCase):
+    """
+    Test the short-text fast path of process_text_input.
+    All AI services are mocked, so no credentials are needed.
+    """
+
+    def setUp(self):
+        """Build an orchestrator whose services are all mocks."""
+        patchers = [
+            patch(f"app.services.kb_orchestrator.{name}", MagicMock())
+            for name in (
+                "PIIMasker",
+                "KBExtractor",
+                "KBMatcher",
+                "KBGenerator",
+                "get_proxy_client",
+                "ChatOpenAI",
+            )
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.orchestrator = KBOrchestrator()
+        self.orchestrator._process_standardized_conversation = AsyncMock()
+
+    def test_short_text_is_ignored_without_ai_calls(self):
+        """Short text returns IGNORE before masking or calling the LLM."""
+        result = asyncio.run(self.orchestrator.process_text_input(text="Hi"))
+
+        self.assertEqual(result.status, "success")
+        self.assertEqual(result.action, KBActionType.IGNORE)
+        self.assertIsNotNone(result.reason)
+        self.assertEqual(result.text_length, 2)
+
+        self.orchestrator._process_standardized_conversation.assert_not_awaited()
+        self.assertEqual(self.orchestrator.masker.method_calls, [])
+        self.assertEqual(self.orchestrator.extractor.method_calls, [])
+        self.assertEqual(self.orchestrator.llm.method_calls, [])
+
+    def test_unspaced_long_text_is_processed(self):
+        """Long text without spaces (e.g. CJK) is not mistaken for short text."""
+        text = "データベース接続がタイムアウトした場合は接続プールの上限を増やしてください" * 2
+        self.assertGreaterEqual(len(text), MIN_TEXT_CHARS)
+        self.assertEqual(len(text.split()), 1)
+
+        asyncio.run(self.orchestrator.process_text_input(text=text))
+
+        self.orchestrator._process_standardized_conversation.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
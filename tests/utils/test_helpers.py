@@ -24,26 +24,28 @@ from app.models.knowledge import (
     DecisionExtraction,
 )
 
-
-def test_flatten_list_empty():
-    """Test flatten_list with empty input."""
-    assert flatten_list(None) == []
-    assert flatten_list([]) == []
-
-
-def test_flatten_list_single_string():
-    """Test flatten_list with single string."""
-    assert flatten_list("test") == ["test"]
-
-
-def test_flatten_list_flat_list():
-    """Test flatten_list with already flat list."""
-    assert flatten_list(["a", "b", "c"]) == ["a", "b", "c"]
+# Single timestamp shared by the sample extraction metadata
+_NOW = datetime.now()
+
+
+@pytest.mark.parametrize(
+    "items, expected",
+    [
+        (None, []),
+        ([], []),
+        ("test", ["test"]),
+        (["a", "b", "c"], ["a", "b", "c"]),
+        ([["a", "b"], ["c"]], ["a", "b", "c"]),
+    ],
+    ids=["none", "empty", "single_string", "flat_list", "nested"],
+)
+def test_flatten_list(items, expected):
+    """Test flatten_list across empty, scalar, flat and nested inputs."""
+    assert flatten_list(items) == expected
 
 
-def test_flatten_list_nested():
-    """Test flatten_list with nested list."""
-    assert flatten_list([["a", "b"], ["c"]]) == ["a", "b", "c"]
+def test_flatten_list_deeply_nested():
+    """Test flatten_list with deeply nested list."""
     # Deeply nested lists get flattened to one level
     result = flatten_list([[["nested"]]])
     assert len(result) == 1
@@ -74,8 +76,8 @@ def test_format_kb_document_content_troubleshooting():
     metadata = ExtractionMetadata(
         source_type="text",
         source_id="test_troubleshooting",
-        history_from=datetime.now(),
-        history_to=datetime.now(),
+        history_from=_NOW,
+        history_to=_NOW,
         message_limit=1,
     )
 
@@ -118,8 +120,8 @@ def test_format_kb_document_content_process():
     metadata = ExtractionMetadata(
         source_type="text",
         source_id="test_process",
-        history_from=datetime.now(),
-        history_to=datetime.now(),
+        history_from=_NOW,
+        history_to=_NOW,
         message_limit=1,
     )
 
@@ -162,8 +164,8 @@ def test_format_kb_document_content_decision():
     metadata = ExtractionMetadata(
         source_type="text",
         source_id="test_decision",
-        history_from=datetime.now(),
-        history_to=datetime.now(),
+        history_from=_NOW,
+        history_to=_NOW,
         message_limit=1,
     )
 